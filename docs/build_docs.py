@@ -1,6 +1,8 @@
 """
 Script to build the SAGE documentation.
 Run this script from the docs directory to generate HTML documentation.
+
+Pass --clean to wipe the build and generated module docs for a full rebuild.
 """
 
 import os
@@ -8,34 +10,28 @@ import subprocess
 import sys
 import shutil
 
+# Number of parallel Sphinx workers; CI can pin this via SPHINX_JOBS
+sphinx_jobs = os.environ.get('SPHINX_JOBS', 'auto')
+
+# Resolve the sphinx-build binary once and fail fast if it isn't installed,
+# rather than letting subprocess raise a FileNotFoundError mid-build
+sphinx_build = shutil.which('sphinx-build')
+if sphinx_build is None:
+    sys.exit("sphinx-build not found - install the docs dependencies first "
+             "(pip install sage-data-quality[dev])")
+
+# Optional full rebuild: wipe the doctree cache and generated API docs
+if '--clean' in sys.argv[1:]:
+    shutil.rmtree('_build', ignore_errors=True)
+    shutil.rmtree('autoapi', ignore_errors=True)
+
 # Create necessary directories
 os.makedirs('_build/html', exist_ok=True)
-os.makedirs('modules', exist_ok=True)
-
-# Generate module documentation
-if not os.path.exists('modules/index.rst'):
-    with open('modules/index.rst', 'w') as f:
-        f.write('''API Reference
-============
-
-.. toctree::
-   :maxdepth: 2
-
-   sage
-''')
-
-# Generate the API documentation using sphinx-apidoc
-subprocess.run([
-    'sphinx-apidoc',
-    '-o',
-    'modules',
-    '--force',
-    '--module-first',
-    '../src/sage'
-])
-
-# Build the HTML documentation
-build_result = subprocess.run(['sphinx-build', '-b', 'html', '.', '_build/html'])
+
+# Build the HTML documentation; API stubs are generated during the read
+# phase by sphinx-autoapi (configured in conf.py), so there is no separate
+# sphinx-apidoc step
+build_result = subprocess.run([sphinx_build, '-b', 'html', '-j', sphinx_jobs, '.', '_build/html'])
 
 if build_result.returncode == 0:
     print("\nDocumentation built successfully! Open _build/html/index.html to view it.")
@@ -8,13 +8,309 @@ orders, and shipping for use in testing SAGE data quality metrics.
 
 import os
 import sys
-import random
 import string
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 import pandas as pd
 from datetime import datetime, timedelta
 from pathlib import Path
-import uuid
+
+
+def _get_rng(section, base_seed=42):
+    """
+    Derive a stable, independent RNG for a named generation section.
+
+    Seeding each section from a hash of its name means reordering or
+    resizing one section doesn't perturb the random stream of another,
+    and sections can be generated in parallel.
+    """
+    digest = hashlib.md5(f"{base_seed}:{section}".encode()).digest()
+    return np.random.default_rng(int.from_bytes(digest[:8], 'big'))
+
+
+def _random_strings(rng, alphabet, n, length):
+    """
+    Draw n fixed-length random strings from alphabet in one batch.
+
+    Indexes a byte array of the alphabet and reinterprets each row as a
+    single fixed-width string, avoiding a Python ''.join loop per row.
+    """
+    chars = np.frombuffer(alphabet.encode('ascii'), dtype='S1')
+    idx = rng.integers(0, len(chars), size=(n, length))
+    return chars[idx].view(f'S{length}').ravel().astype('U').astype(object)
+
+
+def _bulk_uuid4(n):
+    """
+    Generate n random (version 4) UUID strings in one batch.
+
+    One os.urandom call supplies all the random bytes instead of one
+    syscall per uuid.uuid4(), and formatting goes through bytes.hex()
+    rather than building UUID objects just to stringify them.
+    """
+    raw = np.frombuffer(os.urandom(16 * n), dtype=np.uint8).reshape(n, 16).copy()
+    raw[:, 6] = (raw[:, 6] & 0x0F) | 0x40  # version 4
+    raw[:, 8] = (raw[:, 8] & 0x3F) | 0x80  # RFC 4122 variant
+    flat = raw.tobytes()
+    return [
+        f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+        for h in (flat[i:i + 16].hex() for i in range(0, 16 * n, 16))
+    ]
+
+
+# ---------------------------------------------------------------------------
+# Core data values shared by the generation sections
+# ---------------------------------------------------------------------------
+
+# Customer data
+customer_types = ['Individual', 'Small Business', 'Corporate', 'Government', 'Non-Profit']
+account_statuses = ['Active', 'VIP', 'New', 'At Risk', 'Inactive']
+countries = ['United States', 'Canada', 'United Kingdom', 'Australia', 'Germany', 'France', 'Japan', 'China']
+us_states = ['AL', 'AK', 'AZ', 'AR', 'CA', 'CO', 'CT', 'DE', 'FL', 'GA', 'HI', 'ID', 'IL', 'IN', 'IA', 
+            'KS', 'KY', 'LA', 'ME', 'MD', 'MA', 'MI', 'MN', 'MS', 'MO', 'MT', 'NE', 'NV', 'NH', 'NJ',
+            'NM', 'NY', 'NC', 'ND', 'OH', 'OK', 'OR', 'PA', 'RI', 'SC', 'SD', 'TN', 'TX', 'UT', 'VT',
+            'VA', 'WA', 'WV', 'WI', 'WY']
+
+# Product data
+categories = ['Electronics', 'Office Supplies', 'Furniture', 'Apparel', 'Food & Beverage']
+subcategories = {
+    'Electronics': ['Computers', 'Phones', 'Accessories', 'Audio', 'Cameras'],
+    'Office Supplies': ['Paper', 'Pens & Pencils', 'Organizers', 'Desk Accessories', 'Binders'],
+    'Furniture': ['Desks', 'Chairs', 'Bookcases', 'Tables', 'Filing Cabinets'],
+    'Apparel': ['Shirts', 'Pants', 'Outerwear', 'Footwear', 'Hats'],
+    'Food & Beverage': ['Snacks', 'Beverages', 'Coffee & Tea', 'Candy', 'Meals']
+}
+manufacturers = ['TechCorp', 'OfficeWorld', 'FurnItAll', 'ThreadsInc', 'GoodEats', 'ElectraTech', 
+                'PaperPlus', 'ComfortSeating', 'StyleWear', 'SnackTime']
+
+# Order data
+order_sources = ['Website', 'Phone', 'Email', 'In-Store', 'Sales Rep', 'Partner']
+payment_methods = ['Credit Card', 'PayPal', 'Bank Transfer', 'Check', 'Purchase Order', 'Financing']
+payment_statuses = ['Paid', 'Pending', 'Partially Paid', 'Failed', 'Refunded']
+order_statuses = ['Completed', 'Processing', 'On Hold', 'Cancelled', 'Refunded']
+discount_types = ['None', 'Percentage', 'Fixed Amount', 'Buy One Get One', 'Loyalty Discount', 'Volume Discount']
+
+# Shipping data
+shipping_methods = ['Standard', 'Express', 'Overnight', 'Two-Day', 'International', 'Local Pickup']
+carriers = ['FedEx', 'UPS', 'USPS', 'DHL', 'Local Courier', 'Company Vehicle']
+fulfillment_centers = ['East Coast DC', 'West Coast DC', 'Central DC', 'International DC', 'Local Store']
+
+# Sales data
+sales_regions = ['Northeast', 'Southeast', 'Midwest', 'Southwest', 'West', 'International']
+sales_channels = ['Direct', 'Distributor', 'Retail Partner', 'Online Marketplace', 'Affiliate']
+sales_reps = [f"Rep-{i:03d}" for i in range(1, 21)]
+
+
+def _build_customers(num_customers, now):
+    """Build the customer table as whole-column numpy draws."""
+    
+
+    # All random draws are batched with numpy so whole columns are produced
+    # at once instead of looping row by row through the interpreter; each
+    # section gets its own hash-derived RNG for stable reproducibility
+    rng = _get_rng('customers')
+    n = num_customers
+
+    first_names = ['John', 'Jane', 'Michael', 'Emily', 'David', 'Sarah', 'Robert', 'Lisa',
+                   'William', 'Elizabeth', 'James', 'Maria', 'Thomas', 'Jennifer', 'Charles',
+                   'Karen', 'Joseph', 'Linda', 'Richard', 'Patricia']
+    last_names = ['Smith', 'Johnson', 'Williams', 'Jones', 'Brown', 'Davis', 'Miller', 'Wilson',
+                  'Moore', 'Taylor', 'Anderson', 'Thomas', 'Jackson', 'White', 'Harris', 'Martin',
+                  'Thompson', 'Garcia', 'Martinez', 'Robinson']
+
+    first_name = rng.choice(first_names, size=n)
+    last_name = rng.choice(last_names, size=n)
+
+    # Company names for the ~70% of customers that are businesses
+    company_names_first = ['Global', 'National', 'Premier', 'Elite', 'Advanced', 'Summit', 'Core', 'Prime', 'Central', 'Dynamic']
+    company_names_mid = ['Tech', 'Biz', 'Office', 'Market', 'Trade', 'Retail', 'Supply', 'Service', 'Solutions', 'Systems']
+    company_names_last = ['Inc', 'LLC', 'Corp', 'Co', 'International', 'Group', 'Partners', 'Associates', 'Enterprises', 'Industries']
+    is_business = rng.random(n) < 0.7
+    company_name = np.where(
+        is_business,
+        np.char.add(np.char.add(rng.choice(company_names_first, size=n), ' '),
+                    np.char.add(np.char.add(rng.choice(company_names_mid, size=n), ' '),
+                                rng.choice(company_names_last, size=n))),
+        None
+    )
+
+    # Address columns; US customers get a state and 5-digit zip, others get
+    # no state and a 6-character alphanumeric postal code
+    country = rng.choice(countries, size=n)
+    is_us = country == 'United States'
+    state = np.where(is_us, rng.choice(us_states, size=n), None)
+    foreign_zip = _random_strings(rng, string.digits + string.ascii_uppercase, n, 6)
+    zip_code = np.where(is_us, rng.integers(10000, 100000, size=n).astype(str), foreign_zip)
+
+    address_street = np.char.add(
+        np.char.add(rng.integers(1, 10000, size=n).astype(str), ' '),
+        np.char.add(np.char.add(rng.choice(['Main', 'Oak', 'Pine', 'Maple', 'Cedar', 'Elm', 'Washington', 'Lake'], size=n), ' '),
+                    rng.choice(['St', 'Ave', 'Blvd', 'Rd', 'Dr', 'Ln', 'Way', 'Pl'], size=n))
+    )
+    city = rng.choice(['New York', 'Los Angeles', 'Chicago', 'Houston', 'Phoenix', 'Philadelphia', 'San Antonio', 'San Diego', 'Dallas', 'San Francisco'], size=n)
+
+    # Contact info
+    email = np.char.add(
+        np.char.add(np.char.add(np.char.lower(first_name), '.'), np.char.lower(last_name)),
+        np.char.add(np.char.add(rng.integers(0, 100, size=n).astype('U2'), '@'),
+                    rng.choice(['example.com', 'business.net', 'mycompany.org', 'mail.com'], size=n))
+    ).astype(object)
+    phone = np.char.add(
+        np.char.add(rng.integers(100, 1000, size=n).astype(str), '-'),
+        np.char.add(np.char.add(rng.integers(100, 1000, size=n).astype(str), '-'),
+                    rng.integers(1000, 10000, size=n).astype(str))
+    ).astype(object)
+
+    # Dates relative to now, formatted as ISO strings
+    registration_days = rng.integers(30, 1096, size=n)
+    registration_date = np.datetime_as_string(
+        np.datetime64(now, 'D') - registration_days.astype('timedelta64[D]'), unit='D').astype(object)
+    # Kept as native datetime64 so to_excel writes real date cells and the
+    # summary never has to re-parse strings (registration_date stays a string
+    # column because the injected mixed-format issue depends on it)
+    last_purchase_date = (np.datetime64(now, 'D')
+                          - rng.integers(0, 181, size=n).astype('timedelta64[D]')).astype('datetime64[ns]')
+
+    lifetime_value = rng.uniform(100, 50000, size=n).round(2)
+
+    # Introduce data quality issues in ~5% of records: pick an issue type per
+    # row and apply each one with a vectorized mask
+    issue_type = np.where(rng.random(n) < 0.05, rng.integers(1, 6, size=n), 0)
+    email[issue_type == 1] = None                                     # Missing email
+    bad_phone = issue_type == 2                                       # Invalid phone format
+    n_bad_phone = int(bad_phone.sum())
+    phone[bad_phone] = np.char.add(rng.integers(100, 1000, size=n_bad_phone).astype(str),
+                                   rng.integers(1000000, 10000000, size=n_bad_phone).astype(str))
+    address_street = address_street.astype(object)
+    address_street[issue_type == 3] = None                            # Missing address components
+    bad_dates = pd.to_datetime(registration_date[issue_type == 4]).strftime('%m/%d/%Y')
+    registration_date[issue_type == 4] = bad_dates                    # Inconsistent date format
+    lifetime_value[issue_type == 5] *= -1                             # Negative value
+
+    df_customers = pd.DataFrame({
+        'customer_id': np.arange(1, n + 1),
+        'customer_uuid': _bulk_uuid4(n),
+        'first_name': first_name,
+        'last_name': last_name,
+        'company_name': company_name,
+        'customer_type': rng.choice(customer_types, size=n),
+        'account_status': rng.choice(account_statuses, size=n),
+        'email': email,
+        'phone': phone,
+        'address': address_street,
+        'city': city,
+        'state': state,
+        'zip_code': zip_code,
+        'country': country,
+        'registration_date': registration_date,
+        'last_purchase_date': last_purchase_date,
+        'total_orders': rng.integers(1, 51, size=n),
+        'lifetime_value': lifetime_value,
+        'credit_limit': rng.choice(np.array([1000, 2000, 5000, 10000, 25000, 50000, None], dtype=object), size=n),
+        'payment_terms': rng.choice(['Net 30', 'Net 15', 'Net 45', 'Due on Receipt', 'Prepaid'], size=n),
+        'notes': rng.choice(np.array(['VIP Customer', 'Requires special handling', 'Tax exempt',
+                                      'Credit hold', 'Previous returns', None, None, None, None], dtype=object), size=n),
+    }, copy=False)
+
+    return df_customers
+
+
+def _build_products(num_products):
+    """Build the product table the same way."""
+    
+    n_prod = num_products
+    rng = _get_rng('products')
+
+    # Same batched-sampling approach as the customer section: build every
+    # column as one array and fix prices up with vectorized comparisons
+    category = rng.choice(categories, size=n_prod)
+    subcategory = np.empty(n_prod, dtype=object)
+    for cat in categories:
+        mask = category == cat
+        subcategory[mask] = rng.choice(subcategories[cat], size=int(mask.sum()))
+
+    manufacturer = rng.choice(manufacturers, size=n_prod).astype(object)
+
+    adjectives = ['Premium', 'Basic', 'Advanced', 'Deluxe', 'Standard', 'Professional', 'Commercial', 'Economy']
+    product_name = np.char.add(
+        np.char.add(rng.choice(adjectives, size=n_prod), ' '),
+        np.char.add(np.char.add(subcategory.astype(str), ' '),
+                    rng.choice(['Pro', 'Plus', 'Max', 'Lite', 'Ultra', ''], size=n_prod))
+    )
+    description = np.char.add(
+        np.char.add(np.char.add(manufacturer.astype(str), ' '), product_name),
+        np.char.add(np.char.add(' - High-quality ', np.char.lower(subcategory.astype(str))),
+                    ' for professional use')
+    )
+
+    # SKU: first two letters of category + subcategory, upper-cased, plus a
+    # random 4-digit suffix (astype('U2') truncates to two characters)
+    product_sku = np.char.add(
+        np.char.add(np.char.upper(category.astype('U2')), np.char.upper(subcategory.astype('U2'))),
+        np.char.add('-', rng.integers(1000, 10000, size=n_prod).astype(str))
+    )
+
+    unit_cost = rng.uniform(10, 500, size=n_prod).round(2)
+    unit_price = rng.uniform(15, 1000, size=n_prod).round(2)
+    minimum_price = rng.uniform(10, 400, size=n_prod).round(2)
+    msrp = rng.uniform(20, 1200, size=n_prod).round(2)
+
+    # Price fixups, vectorized: enforce the margin floor, keep the minimum
+    # price below the unit price and the MSRP above it
+    base_margin = rng.uniform(0.2, 0.6, size=n_prod)  # 20-60% margin
+    unit_price = np.maximum(unit_price, np.round(unit_cost * (1 + base_margin), 2))
+    minimum_price = np.where(minimum_price >= unit_price, np.round(unit_price * 0.9, 2), minimum_price)
+    msrp = np.where(msrp <= unit_price, np.round(unit_price * 1.2, 2), msrp)
+
+    dimensions = np.char.add(
+        np.char.add(rng.integers(1, 51, size=n_prod).astype(str), 'x'),
+        np.char.add(np.char.add(rng.integers(1, 51, size=n_prod).astype(str), 'x'),
+                    rng.integers(1, 51, size=n_prod).astype(str))
+    ).astype(object)
+    current_stock = rng.integers(0, 1001, size=n_prod)
+
+    # Introduce data quality issues in ~5% of records
+    issue_type = np.where(rng.random(n_prod) < 0.05, rng.integers(1, 6, size=n_prod), 0)
+    current_stock[issue_type == 1] = -rng.integers(1, 11, size=int((issue_type == 1).sum()))  # Negative inventory
+    bad_price = issue_type == 2                                                               # Price lower than cost
+    unit_price[bad_price] = unit_cost[bad_price] * rng.uniform(0.5, 0.9, size=int(bad_price.sum()))
+    manufacturer[issue_type == 3] = None                                                      # Missing manufacturer
+    bad_dim = issue_type == 4                                                                 # Invalid dimensions format
+    n_bad_dim = int(bad_dim.sum())
+    dimensions[bad_dim] = np.char.add(np.char.add(rng.integers(1, 51, size=n_bad_dim).astype(str), ' x '),
+                                      rng.integers(1, 51, size=n_bad_dim).astype(str))
+    all_subcategories = [sub for subs in subcategories.values() for sub in subs]
+    bad_subcat = issue_type == 5                                                              # Inconsistent category/subcategory
+    subcategory[bad_subcat] = rng.choice(all_subcategories, size=int(bad_subcat.sum()))
+
+    df_products = pd.DataFrame({
+        'product_id': np.arange(1, n_prod + 1),
+        'product_sku': product_sku,
+        'product_name': product_name,
+        'description': description,
+        'category': category,
+        'subcategory': subcategory,
+        'manufacturer': manufacturer,
+        'supplier': rng.choice(['DirectSupply Inc', 'GlobalSource Ltd', 'PremierVendors', 'RegionalDistro', 'ImportExport Co'], size=n_prod),
+        'unit_cost': unit_cost,
+        'unit_price': unit_price,
+        'minimum_price': minimum_price,
+        'msrp': msrp,
+        'weight_lbs': rng.uniform(0.1, 100, size=n_prod).round(2),
+        'dimensions': dimensions,
+        'color': rng.choice(['Black', 'White', 'Gray', 'Silver', 'Blue', 'Red', 'Brown', 'Green'], size=n_prod),
+        'current_stock': current_stock,
+        'reorder_level': rng.integers(5, 101, size=n_prod),
+        'reorder_quantity': rng.integers(10, 201, size=n_prod),
+        'lead_time_days': rng.integers(1, 61, size=n_prod),
+        'is_taxable': rng.random(n_prod) < 0.75,     # 75% taxable
+        'is_active': rng.random(n_prod) < 0.8,       # 80% active
+        'discontinued': rng.random(n_prod) < 0.2,    # 20% discontinued
+    }, copy=False)
+
+    return df_products
+
 
 def generate_order_data(num_orders=150, output_path=None):
     """
@@ -28,457 +324,269 @@ def generate_order_data(num_orders=150, output_path=None):
         Path to the generated Excel file
     """
     print(f"Generating detailed order data for {num_orders} orders...")
-    
+
+    # Single wall-clock read for the whole run; every generated date and
+    # the default filename derive from this one timestamp
+    now = datetime.now()
+
     # Create a directory for example data if it doesn't exist
     if output_path is None:
         data_dir = os.path.join(os.path.dirname(__file__), 'data')
         os.makedirs(data_dir, exist_ok=True)
-        output_path = os.path.join(data_dir, f'business_orders_{datetime.now().strftime("%Y%m%d")}.xlsx')
-    
-    # Set random seed for reproducibility
-    random.seed(42)
-    np.random.seed(42)
-    
+        output_path = os.path.join(data_dir, f'business_orders_{now.strftime("%Y%m%d")}.xlsx')
+    num_customers = max(50, int(num_orders * 0.7))  # Some customers will have multiple orders
+    num_products = 100
+
+    # Customers and products are independent (separate RNG streams), so
+    # build them concurrently; orders depend on both and run after
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        customers_future = executor.submit(_build_customers, num_customers, now)
+        products_future = executor.submit(_build_products, num_products)
+        df_customers = customers_future.result()
+        df_products = products_future.result()
+
     # ---------------------------------------------------------------------------
-    # Define core data values
+    # Generate Order Data
     # ---------------------------------------------------------------------------
     
-    # Customer data
-    customer_types = ['Individual', 'Small Business', 'Corporate', 'Government', 'Non-Profit']
-    account_statuses = ['Active', 'VIP', 'New', 'At Risk', 'Inactive']
-    countries = ['United States', 'Canada', 'United Kingdom', 'Australia', 'Germany', 'France', 'Japan', 'China']
-    us_states = ['AL', 'AK', 'AZ', 'AR', 'CA', 'CO', 'CT', 'DE', 'FL', 'GA', 'HI', 'ID', 'IL', 'IN', 'IA', 
-                'KS', 'KY', 'LA', 'ME', 'MD', 'MA', 'MI', 'MN', 'MS', 'MO', 'MT', 'NE', 'NV', 'NH', 'NJ',
-                'NM', 'NY', 'NC', 'ND', 'OH', 'OK', 'OR', 'PA', 'RI', 'SC', 'SD', 'TN', 'TX', 'UT', 'VT',
-                'VA', 'WA', 'WV', 'WI', 'WY']
-    
-    # Product data
-    categories = ['Electronics', 'Office Supplies', 'Furniture', 'Apparel', 'Food & Beverage']
-    subcategories = {
-        'Electronics': ['Computers', 'Phones', 'Accessories', 'Audio', 'Cameras'],
-        'Office Supplies': ['Paper', 'Pens & Pencils', 'Organizers', 'Desk Accessories', 'Binders'],
-        'Furniture': ['Desks', 'Chairs', 'Bookcases', 'Tables', 'Filing Cabinets'],
-        'Apparel': ['Shirts', 'Pants', 'Outerwear', 'Footwear', 'Hats'],
-        'Food & Beverage': ['Snacks', 'Beverages', 'Coffee & Tea', 'Candy', 'Meals']
+    # The per-order/per-item Python loops are replaced with flat arrays:
+    # order-level draws sized num_orders, item-level draws sized total_items,
+    # with np.repeat/np.add.reduceat bridging the two axes. All the numeric
+    # work (pricing, discounts, tax, totals) happens in whole-array ops.
+    n_ord = num_orders
+    rng = _get_rng('orders')
+    order_ids = np.arange(1, n_ord + 1, dtype=np.int32)
+    num_items_per_order = rng.integers(1, 11, size=n_ord, dtype=np.int32)
+    total_items = int(num_items_per_order.sum())
+
+    # Customer cross-reference for each order: gather whole columns from
+    # the customer table by integer index, same as the product lookups
+    customer_idx = rng.integers(0, len(df_customers), size=n_ord)
+    cust_cols = {
+        col: df_customers[col].to_numpy()[customer_idx]
+        for col in ('customer_id', 'first_name', 'last_name', 'company_name',
+                    'address', 'city', 'state', 'zip_code', 'country')
     }
-    manufacturers = ['TechCorp', 'OfficeWorld', 'FurnItAll', 'ThreadsInc', 'GoodEats', 'ElectraTech', 
-                    'PaperPlus', 'ComfortSeating', 'StyleWear', 'SnackTime']
-    
-    # Order data
-    order_sources = ['Website', 'Phone', 'Email', 'In-Store', 'Sales Rep', 'Partner']
-    payment_methods = ['Credit Card', 'PayPal', 'Bank Transfer', 'Check', 'Purchase Order', 'Financing']
-    payment_statuses = ['Paid', 'Pending', 'Partially Paid', 'Failed', 'Refunded']
-    order_statuses = ['Completed', 'Processing', 'On Hold', 'Cancelled', 'Refunded']
-    discount_types = ['None', 'Percentage', 'Fixed Amount', 'Buy One Get One', 'Loyalty Discount', 'Volume Discount']
-    
-    # Shipping data
-    shipping_methods = ['Standard', 'Express', 'Overnight', 'Two-Day', 'International', 'Local Pickup']
-    carriers = ['FedEx', 'UPS', 'USPS', 'DHL', 'Local Courier', 'Company Vehicle']
-    fulfillment_centers = ['East Coast DC', 'West Coast DC', 'Central DC', 'International DC', 'Local Store']
-    
-    # Sales data
-    sales_regions = ['Northeast', 'Southeast', 'Midwest', 'Southwest', 'West', 'International']
-    sales_channels = ['Direct', 'Distributor', 'Retail Partner', 'Online Marketplace', 'Affiliate']
-    sales_reps = [f"Rep-{i:03d}" for i in range(1, 21)]
-    
-    # ---------------------------------------------------------------------------
-    # Generate Customer Data
-    # ---------------------------------------------------------------------------
-    
-    num_customers = max(50, int(num_orders * 0.7))  # Some customers will have multiple orders
-    customers = []
-    
-    for i in range(1, num_customers + 1):
-        first_name = random.choice(['John', 'Jane', 'Michael', 'Emily', 'David', 'Sarah', 'Robert', 'Lisa', 
-                                   'William', 'Elizabeth', 'James', 'Maria', 'Thomas', 'Jennifer', 'Charles', 
-                                   'Karen', 'Joseph', 'Linda', 'Richard', 'Patricia'])
-        last_name = random.choice(['Smith', 'Johnson', 'Williams', 'Jones', 'Brown', 'Davis', 'Miller', 'Wilson', 
-                                  'Moore', 'Taylor', 'Anderson', 'Thomas', 'Jackson', 'White', 'Harris', 'Martin',
-                                  'Thompson', 'Garcia', 'Martinez', 'Robinson'])
-        
-        # Generate company name for non-individual customers
-        if random.random() < 0.7:  # 70% chance of being a business
-            company_names_first = ['Global', 'National', 'Premier', 'Elite', 'Advanced', 'Summit', 'Core', 'Prime', 'Central', 'Dynamic']
-            company_names_mid = ['Tech', 'Biz', 'Office', 'Market', 'Trade', 'Retail', 'Supply', 'Service', 'Solutions', 'Systems']
-            company_names_last = ['Inc', 'LLC', 'Corp', 'Co', 'International', 'Group', 'Partners', 'Associates', 'Enterprises', 'Industries']
-            company_name = f"{random.choice(company_names_first)} {random.choice(company_names_mid)} {random.choice(company_names_last)}"
-        else:
-            company_name = None
-        
-        customer_type = random.choice(customer_types)
-        account_status = random.choice(account_statuses)
-        
-        # Generate address
-        country = random.choice(countries)
-        if country == 'United States':
-            state = random.choice(us_states)
-            zip_code = f"{random.randint(10000, 99999)}"
-        else:
-            state = None
-            zip_code = ''.join(random.choices(string.digits + string.ascii_uppercase, k=6))
-        
-        address_street = f"{random.randint(1, 9999)} {random.choice(['Main', 'Oak', 'Pine', 'Maple', 'Cedar', 'Elm', 'Washington', 'Lake'])} {random.choice(['St', 'Ave', 'Blvd', 'Rd', 'Dr', 'Ln', 'Way', 'Pl'])}"
-        city = random.choice(['New York', 'Los Angeles', 'Chicago', 'Houston', 'Phoenix', 'Philadelphia', 'San Antonio', 'San Diego', 'Dallas', 'San Francisco'])
-        
-        # Generate contact info
-        email = f"{first_name.lower()}.{last_name.lower()}{''.join(random.choices(string.digits, k=2))}@{random.choice(['example.com', 'business.net', 'mycompany.org', 'mail.com'])}"
-        phone = f"{random.randint(100, 999)}-{random.randint(100, 999)}-{random.randint(1000, 9999)}"
-        
-        # Create customer record
-        customer = {
-            'customer_id': i,
-            'customer_uuid': str(uuid.uuid4()),
-            'first_name': first_name,
-            'last_name': last_name,
-            'company_name': company_name,
-            'customer_type': customer_type,
-            'account_status': account_status,
-            'email': email,
-            'phone': phone,
-            'address': address_street,
-            'city': city,
-            'state': state,
-            'zip_code': zip_code,
-            'country': country,
-            'registration_date': (datetime.now() - timedelta(days=random.randint(30, 1095))).strftime('%Y-%m-%d'),
-            'last_purchase_date': (datetime.now() - timedelta(days=random.randint(0, 180))).strftime('%Y-%m-%d'),
-            'total_orders': random.randint(1, 50),
-            'lifetime_value': round(random.uniform(100, 50000), 2),
-            'credit_limit': random.choice([1000, 2000, 5000, 10000, 25000, 50000, None]),
-            'payment_terms': random.choice(['Net 30', 'Net 15', 'Net 45', 'Due on Receipt', 'Prepaid']),
-            'notes': random.choice(['VIP Customer', 'Requires special handling', 'Tax exempt', 'Credit hold', 'Previous returns', None, None, None, None])
-        }
-        
-        # Introduce data quality issues in ~5% of records
-        if random.random() < 0.05:
-            issue_type = random.randint(1, 5)
-            if issue_type == 1:
-                # Missing email
-                customer['email'] = None
-            elif issue_type == 2:
-                # Invalid phone format
-                customer['phone'] = f"{random.randint(100, 999)}{random.randint(1000000, 9999999)}"
-            elif issue_type == 3:
-                # Missing address components
-                customer['address'] = None
-            elif issue_type == 4:
-                # Inconsistent date format
-                customer['registration_date'] = (datetime.now() - timedelta(days=random.randint(30, 1095))).strftime('%m/%d/%Y')
-            elif issue_type == 5:
-                # Negative value
-                customer['lifetime_value'] = -1 * customer['lifetime_value']
-        
-        customers.append(customer)
-    
+
+    # Order dates; cancelled/refunded orders lose their ship/delivery dates
+    order_date = np.datetime64(now, 's') - rng.integers(1, 366, size=n_ord).astype('timedelta64[D]')
+    ship_date = order_date.astype('datetime64[D]') + rng.integers(1, 11, size=n_ord).astype('timedelta64[D]')
+    delivery_date = ship_date + rng.integers(1, 8, size=n_ord).astype('timedelta64[D]')
+
+    order_status = rng.choice(order_statuses, size=n_ord,
+                              p=[0.7, 0.15, 0.05, 0.05, 0.05])  # 70% completed, 15% processing, 5% each for others
+    not_shipped = np.isin(order_status, ['Cancelled', 'Refunded'])
+
+    # Payment status, adjusted for cancelled/refunded orders
+    payment_status = rng.choice(payment_statuses, size=n_ord).astype(object)
+    cancelled = order_status == 'Cancelled'
+    payment_status[cancelled] = rng.choice(['Refunded', 'None'], size=int(cancelled.sum()))
+    payment_status[order_status == 'Refunded'] = 'Refunded'
+
+    # Tracking numbers for shipped orders only
+    tracking_number = _random_strings(rng, string.ascii_uppercase + string.digits, n_ord, 12)
+    tracking_number[not_shipped] = None
+
+    # Discounts: type is sampled with the same weights as before, then the
+    # amount/percentage columns are filled in per type with masks
+    discount_type = rng.choice(discount_types, size=n_ord,
+                               p=[0.6, 0.1, 0.1, 0.05, 0.05, 0.1])  # 60% no discount
+    discount_amount = np.zeros(n_ord)
+    discount_pct = np.zeros(n_ord, dtype=np.int64)
+    is_pct = discount_type == 'Percentage'
+    discount_pct[is_pct] = rng.choice([5, 10, 15, 20, 25, 30], size=int(is_pct.sum()))
+    is_fixed = discount_type == 'Fixed Amount'
+    discount_amount[is_fixed] = rng.choice([10, 25, 50, 100], size=int(is_fixed.sum()))
+    is_other = ~np.isin(discount_type, ['None', 'Percentage', 'Fixed Amount'])
+    discount_amount[is_other] = rng.choice([0, 10, 25, 50], size=int(is_other.sum()))
+    discount_pct[is_other] = rng.choice([0, 5, 10, 15], size=int(is_other.sum()))
+
+    shipping_cost = rng.uniform(5, 50, size=n_ord).round(2)
+    tax_rate = rng.uniform(0.05, 0.095, size=n_ord).round(3)
+
     # ---------------------------------------------------------------------------
-    # Generate Product Data
+    # Item-level arrays (flat axis of total_items, grouped by order)
     # ---------------------------------------------------------------------------
-    
-    num_products = 100
-    products = []
-    
-    for i in range(1, num_products + 1):
-        category = random.choice(categories)
-        subcategory = random.choice(subcategories[category])
-        
-        manufacturer = random.choice(manufacturers)
-        
-        # Generate product name
-        adjectives = ['Premium', 'Basic', 'Advanced', 'Deluxe', 'Standard', 'Professional', 'Commercial', 'Economy']
-        product_name = f"{random.choice(adjectives)} {subcategory} {random.choice(['Pro', 'Plus', 'Max', 'Lite', 'Ultra', ''])}"
-        
-        # Create product record
-        product = {
-            'product_id': i,
-            'product_sku': f"{category[:2].upper()}{subcategory[:2].upper()}-{random.randint(1000, 9999)}",
-            'product_name': product_name,
-            'description': f"{manufacturer} {product_name} - High-quality {subcategory.lower()} for professional use",
-            'category': category,
-            'subcategory': subcategory,
-            'manufacturer': manufacturer,
-            'supplier': random.choice(['DirectSupply Inc', 'GlobalSource Ltd', 'PremierVendors', 'RegionalDistro', 'ImportExport Co']),
-            'unit_cost': round(random.uniform(10, 500), 2),
-            'unit_price': round(random.uniform(15, 1000), 2),
-            'minimum_price': round(random.uniform(10, 400), 2),
-            'msrp': round(random.uniform(20, 1200), 2),
-            'weight_lbs': round(random.uniform(0.1, 100), 2),
-            'dimensions': f"{random.randint(1, 50)}x{random.randint(1, 50)}x{random.randint(1, 50)}",
-            'color': random.choice(['Black', 'White', 'Gray', 'Silver', 'Blue', 'Red', 'Brown', 'Green']),
-            'current_stock': random.randint(0, 1000),
-            'reorder_level': random.randint(5, 100),
-            'reorder_quantity': random.randint(10, 200),
-            'lead_time_days': random.randint(1, 60),
-            'is_taxable': random.choice([True, True, True, False]),  # 75% taxable
-            'is_active': random.choice([True, True, True, True, False]),  # 80% active
-            'discontinued': random.choice([False, False, False, False, True])  # 20% discontinued
-        }
-        
-        # Set profit margin and calculate other price fields
-        base_margin = random.uniform(0.2, 0.6)  # 20-60% margin
-        if product['unit_cost'] * (1 + base_margin) > product['unit_price']:
-            product['unit_price'] = round(product['unit_cost'] * (1 + base_margin), 2)
-        
-        # Ensure minimum price is less than unit price
-        if product['minimum_price'] >= product['unit_price']:
-            product['minimum_price'] = round(product['unit_price'] * 0.9, 2)
-        
-        # Ensure MSRP is higher than unit price
-        if product['msrp'] <= product['unit_price']:
-            product['msrp'] = round(product['unit_price'] * 1.2, 2)
-        
-        # Introduce data quality issues in ~5% of records
-        if random.random() < 0.05:
-            issue_type = random.randint(1, 5)
-            if issue_type == 1:
-                # Negative inventory
-                product['current_stock'] = -random.randint(1, 10)
-            elif issue_type == 2:
-                # Price lower than cost
-                product['unit_price'] = product['unit_cost'] * random.uniform(0.5, 0.9)
-            elif issue_type == 3:
-                # Missing manufacturer
-                product['manufacturer'] = None
-            elif issue_type == 4:
-                # Invalid dimensions format
-                product['dimensions'] = f"{random.randint(1, 50)} x {random.randint(1, 50)}"
-            elif issue_type == 5:
-                # Inconsistent category/subcategory
-                product['subcategory'] = random.choice(subcategories[random.choice(categories)])
-        
-        products.append(product)
-    
+
+    item_order_idx = np.repeat(np.arange(n_ord), num_items_per_order)
+    order_item_ids = np.arange(1, total_items + 1, dtype=np.int32)
+
+    # Products are referenced by integer index straight into the column arrays
+    product_idx = rng.integers(0, num_products, size=total_items, dtype=np.int32)
+    prod_unit_price = df_products['unit_price'].to_numpy()[product_idx]
+    prod_unit_cost = df_products['unit_cost'].to_numpy()[product_idx]
+    prod_min_price = df_products['minimum_price'].to_numpy()[product_idx]
+    prod_msrp = df_products['msrp'].to_numpy()[product_idx]
+    prod_taxable = df_products['is_taxable'].to_numpy()[product_idx]
+
+    quantity = rng.integers(1, 21, size=total_items, dtype=np.int32)
+
+    # 10% of items get custom pricing between minimum price and MSRP
+    custom_price = rng.random(total_items) < 0.1
+    item_unit_price = np.where(custom_price,
+                               rng.uniform(prod_min_price, prod_msrp),
+                               prod_unit_price)
+
+    line_item_subtotal = quantity * item_unit_price
+
+    # 20% of items get an item-specific discount
+    item_discount_pct = np.where(rng.random(total_items) < 0.2,
+                                 rng.choice([5, 10, 15, 20], size=total_items), 0)
+    line_item_discount = line_item_subtotal * (item_discount_pct / 100)
+    line_item_total = line_item_subtotal - line_item_discount
+
+    item_tax_rate = np.where(prod_taxable, tax_rate[item_order_idx], 0.0)
+    item_tax_amount = np.where(prod_taxable, line_item_total * tax_rate[item_order_idx], 0.0)
+
+    # Per-order subtotals: sum each order's contiguous run of line totals
+    group_offsets = np.concatenate(([0], np.cumsum(num_items_per_order)[:-1]))
+    order_subtotal = np.add.reduceat(line_item_total, group_offsets)
+
+    # Order-level totals
+    discount_amount = np.where(is_pct, np.round(order_subtotal * (discount_pct / 100), 2), discount_amount)
+    taxable_amount = order_subtotal - discount_amount
+    tax_amount = np.round(taxable_amount * tax_rate, 2)
+    subtotal = np.round(order_subtotal, 2)
+    total_amount = np.round(subtotal - discount_amount + tax_amount + shipping_cost, 2)
+
     # ---------------------------------------------------------------------------
-    # Generate Order Data
+    # Materialize order-level string columns
     # ---------------------------------------------------------------------------
-    
-    orders = []
-    order_items = []
-    order_item_id = 1
-    
-    for i in range(1, num_orders + 1):
-        # Select customer
-        customer = random.choice(customers)
-        
-        # Generate order dates
-        order_date = datetime.now() - timedelta(days=random.randint(1, 365))
-        ship_date = order_date + timedelta(days=random.randint(1, 10))
-        delivery_date = ship_date + timedelta(days=random.randint(1, 7))
-        
-        # Handle cancelled/refunded orders
-        order_status = random.choices(
-            order_statuses, 
-            weights=[0.7, 0.15, 0.05, 0.05, 0.05],  # 70% completed, 15% processing, 5% each for others
-            k=1
-        )[0]
-        
-        if order_status in ['Cancelled', 'Refunded']:
-            ship_date = None
-            delivery_date = None
-        
-        # Generate order details
-        order_source = random.choice(order_sources)
-        payment_method = random.choice(payment_methods)
-        payment_status = random.choice(payment_statuses)
-        
-        # If cancelled/refunded, adjust payment status accordingly
-        if order_status == 'Cancelled':
-            payment_status = random.choice(['Refunded', 'None'])
-        elif order_status == 'Refunded':
-            payment_status = 'Refunded'
-        
-        # Generate shipping information
-        shipping_method = random.choice(shipping_methods)
-        carrier = random.choice(carriers)
-        fulfillment_center = random.choice(fulfillment_centers)
-        
-        # Generate tracking number if shipped
-        if ship_date and order_status not in ['Cancelled', 'Refunded']:
-            tracking_number = ''.join(random.choices(string.ascii_uppercase + string.digits, k=12))
-        else:
-            tracking_number = None
-        
-        # Generate sales information
-        sales_region = random.choice(sales_regions)
-        sales_channel = random.choice(sales_channels)
-        sales_rep = random.choice(sales_reps)
-        
-        # Decide on discount
-        discount_type = random.choices(
-            discount_types, 
-            weights=[0.6, 0.1, 0.1, 0.05, 0.05, 0.1],  # 60% no discount
-            k=1
-        )[0]
-        
-        if discount_type == 'None':
-            discount_amount = 0
-            discount_pct = 0
-        elif discount_type == 'Percentage':
-            discount_pct = random.choice([5, 10, 15, 20, 25, 30])
-            discount_amount = 0  # Will be calculated after items are added
-        elif discount_type == 'Fixed Amount':
-            discount_amount = random.choice([10, 25, 50, 100])
-            discount_pct = 0
-        else:
-            # Other discount types
-            discount_amount = random.choice([0, 10, 25, 50])
-            discount_pct = random.choice([0, 5, 10, 15])
-        
-        # Create order record (subtotal will be calculated after adding items)
-        order = {
-            'order_id': i,
-            'order_number': f"ORD-{datetime.now().year}-{i:05d}",
-            'order_uuid': str(uuid.uuid4()),
-            'customer_id': customer['customer_id'],
-            'customer_name': f"{customer['first_name']} {customer['last_name']}",
-            'company_name': customer['company_name'],
-            'order_date': order_date.strftime('%Y-%m-%d'),
-            'order_time': order_date.strftime('%H:%M:%S'),
-            'order_status': order_status,
-            'order_source': order_source,
-            'payment_method': payment_method,
-            'payment_status': payment_status,
-            'subtotal': 0,  # Will be calculated
-            'shipping_cost': round(random.uniform(5, 50), 2),
-            'tax_rate': round(random.uniform(0.05, 0.095), 3),
-            'tax_amount': 0,  # Will be calculated
-            'discount_type': discount_type,
-            'discount_amount': discount_amount,
-            'discount_pct': discount_pct,
-            'total_amount': 0,  # Will be calculated
-            'currency': 'USD',
-            'shipping_method': shipping_method,
-            'carrier': carrier,
-            'tracking_number': tracking_number,
-            'fulfillment_center': fulfillment_center,
-            'ship_date': ship_date.strftime('%Y-%m-%d') if ship_date else None,
-            'delivery_date': delivery_date.strftime('%Y-%m-%d') if delivery_date else None,
-            'shipping_address': customer['address'],
-            'shipping_city': customer['city'],
-            'shipping_state': customer['state'],
-            'shipping_zip': customer['zip_code'],
-            'shipping_country': customer['country'],
-            'billing_address': customer['address'],  # Same as shipping for simplicity
-            'billing_city': customer['city'],
-            'billing_state': customer['state'],
-            'billing_zip': customer['zip_code'],
-            'billing_country': customer['country'],
-            'sales_region': sales_region,
-            'sales_channel': sales_channel,
-            'sales_rep': sales_rep,
-            'customer_po': f"PO-{random.randint(10000, 99999)}" if random.random() < 0.3 else None,
-            'notes': random.choice([
-                'Rush order', 'Special packaging required', 'Customer requested delivery notification',
-                'Fragile items', 'Gift wrapping requested', None, None, None, None, None
-            ])
-        }
-        
-        # Generate a random number of items for this order (1-10)
-        num_items = random.randint(1, 10)
-        order_subtotal = 0
-        
-        # Add items to the order
-        for j in range(num_items):
-            # Select a random product
-            product = random.choice(products)
-            
-            # Determine quantity
-            quantity = random.randint(1, 20)
-            
-            # Calculate item price and discounts
-            unit_price = product['unit_price']
-            
-            # Apply random pricing adjustments in some cases
-            if random.random() < 0.1:  # 10% chance of custom pricing
-                unit_price = random.uniform(product['minimum_price'], product['msrp'])
-            
-            # Calculate line item values
-            line_item_subtotal = quantity * unit_price
-            
-            # Apply item-specific discount in some cases
-            item_discount_pct = 0
-            if random.random() < 0.2:  # 20% chance of item-specific discount
-                item_discount_pct = random.choice([5, 10, 15, 20])
-                line_item_discount = line_item_subtotal * (item_discount_pct / 100)
-            else:
-                line_item_discount = 0
-            
-            line_item_total = line_item_subtotal - line_item_discount
-            order_subtotal += line_item_total
-            
-            # Create order item record
-            item = {
-                'order_item_id': order_item_id,
-                'order_id': order['order_id'],
-                'order_number': order['order_number'],
-                'product_id': product['product_id'],
-                'product_sku': product['product_sku'],
-                'product_name': product['product_name'],
-                'quantity': quantity,
-                'unit_price': round(unit_price, 2),
-                'unit_cost': round(product['unit_cost'], 2),
-                'subtotal': round(line_item_subtotal, 2),
-                'discount_pct': item_discount_pct,
-                'discount_amount': round(line_item_discount, 2),
-                'line_total': round(line_item_total, 2),
-                'is_taxable': product['is_taxable'],
-                'tax_rate': order['tax_rate'] if product['is_taxable'] else 0,
-                'tax_amount': round(line_item_total * order['tax_rate'], 2) if product['is_taxable'] else 0,
-                'fulfillment_status': 'Shipped' if order_status == 'Completed' else order_status,
-                'category': product['category'],
-                'manufacturer': product['manufacturer'],
-                'profit_margin': round((unit_price - product['unit_cost']) / unit_price * 100, 2),
-                'profit_amount': round((unit_price - product['unit_cost']) * quantity, 2)
-            }
-            
-            order_items.append(item)
-            order_item_id += 1
-        
-        # Update order with calculated totals
-        order['subtotal'] = round(order_subtotal, 2)
-        
-        # Apply order discount if applicable
-        if discount_type == 'Percentage':
-            order['discount_amount'] = round(order_subtotal * (discount_pct / 100), 2)
-        
-        # Calculate taxable amount (after discounts)
-        taxable_amount = order_subtotal - order['discount_amount']
-        order['tax_amount'] = round(taxable_amount * order['tax_rate'], 2)
-        
-        # Calculate total amount
-        order['total_amount'] = round(order['subtotal'] - order['discount_amount'] + order['tax_amount'] + order['shipping_cost'], 2)
-        
-        # Introduce data quality issues in ~5% of records
-        if random.random() < 0.05:
-            issue_type = random.randint(1, 5)
-            if issue_type == 1:
-                # Inconsistent date format
-                order['order_date'] = order_date.strftime('%m/%d/%Y')
-            elif issue_type == 2:
-                # Negative total amount
-                order['total_amount'] = -order['total_amount']
-            elif issue_type == 3:
-                # Missing customer information
-                order['customer_name'] = None
-            elif issue_type == 4:
-                # Shipping before order date
-                if order['ship_date']:
-                    order['ship_date'] = (order_date - timedelta(days=random.randint(1, 5))).strftime('%Y-%m-%d')
-            elif issue_type == 5:
-                # Mathematical inconsistency
-                order['total_amount'] = round(order['total_amount'] * random.uniform(0.9, 1.1), 2)
-        
-        orders.append(order)
+
+    order_number = np.char.add(f"ORD-{now.year}-",
+                               np.char.zfill(order_ids.astype(str), 5)).astype(object)
+    order_date_str = np.datetime_as_string(order_date.astype('datetime64[D]'), unit='D').astype(object)
+    order_time_str = np.array([s[11:19] for s in np.datetime_as_string(order_date, unit='s')], dtype=object)
+    # Ship/delivery stay native datetime64 (NaT when not shipped) so Excel
+    # gets real date cells with no string round-trip
+    ship_date = ship_date.astype('datetime64[ns]')
+    ship_date[not_shipped] = np.datetime64('NaT')
+    delivery_date = delivery_date.astype('datetime64[ns]')
+    delivery_date[not_shipped] = np.datetime64('NaT')
+
+    customer_name = np.char.add(np.char.add(cust_cols['first_name'].astype(str), ' '),
+                                cust_cols['last_name'].astype(str)).astype(object)
+
+    has_po = rng.random(n_ord) < 0.3
+    customer_po = np.char.add('PO-', rng.integers(10000, 100000, size=n_ord).astype(str)).astype(object)
+    customer_po[~has_po] = None
+
+    # Introduce data quality issues in ~5% of records
+    issue_type = np.where(rng.random(n_ord) < 0.05, rng.integers(1, 6, size=n_ord), 0)
+    bad_date = issue_type == 1                                                  # Inconsistent date format
+    order_date_str[bad_date] = pd.to_datetime(order_date_str[bad_date]).strftime('%m/%d/%Y')
+    total_amount[issue_type == 2] *= -1                                         # Negative total amount
+    customer_name[issue_type == 3] = None                                       # Missing customer information
+    bad_ship = (issue_type == 4) & ~not_shipped                                 # Shipping before order date
+    early_ship = (order_date.astype('datetime64[D]')
+                  - rng.integers(1, 6, size=n_ord).astype('timedelta64[D]')).astype('datetime64[ns]')
+    ship_date[bad_ship] = early_ship[bad_ship]
+    bad_total = issue_type == 5                                                 # Mathematical inconsistency
+    total_amount[bad_total] = np.round(total_amount[bad_total] * rng.uniform(0.9, 1.1, size=int(bad_total.sum())), 2)
+
+    df_orders = pd.DataFrame({
+        'order_id': order_ids,
+        'order_number': order_number,
+        'order_uuid': _bulk_uuid4(n_ord),
+        'customer_id': cust_cols['customer_id'],
+        'customer_name': customer_name,
+        'company_name': cust_cols['company_name'],
+        'order_date': order_date_str,
+        'order_time': order_time_str,
+        'order_status': order_status,
+        'order_source': rng.choice(order_sources, size=n_ord),
+        'payment_method': rng.choice(payment_methods, size=n_ord),
+        'payment_status': payment_status,
+        'subtotal': subtotal,
+        'shipping_cost': shipping_cost,
+        'tax_rate': tax_rate,
+        'tax_amount': tax_amount,
+        'discount_type': discount_type,
+        'discount_amount': discount_amount,
+        'discount_pct': discount_pct,
+        'total_amount': total_amount,
+        'currency': 'USD',
+        'shipping_method': rng.choice(shipping_methods, size=n_ord),
+        'carrier': rng.choice(carriers, size=n_ord),
+        'tracking_number': tracking_number,
+        'fulfillment_center': rng.choice(fulfillment_centers, size=n_ord),
+        'ship_date': ship_date,
+        'delivery_date': delivery_date,
+        'shipping_address': cust_cols['address'],
+        'shipping_city': cust_cols['city'],
+        'shipping_state': cust_cols['state'],
+        'shipping_zip': cust_cols['zip_code'],
+        'shipping_country': cust_cols['country'],
+        'billing_address': cust_cols['address'],  # Same as shipping for simplicity
+        'billing_city': cust_cols['city'],
+        'billing_state': cust_cols['state'],
+        'billing_zip': cust_cols['zip_code'],
+        'billing_country': cust_cols['country'],
+        'sales_region': rng.choice(sales_regions, size=n_ord),
+        'sales_channel': rng.choice(sales_channels, size=n_ord),
+        'sales_rep': rng.choice(sales_reps, size=n_ord),
+        'customer_po': customer_po,
+        'notes': rng.choice(np.array([
+            'Rush order', 'Special packaging required', 'Customer requested delivery notification',
+            'Fragile items', 'Gift wrapping requested', None, None, None, None, None
+        ], dtype=object), size=n_ord),
+    }, copy=False)
+
+    item_status = np.where(order_status == 'Completed', 'Shipped', order_status)
+
+    # These item arrays aren't used again after this point, so round them
+    # in place rather than allocating rounded copies for the DataFrame
+    np.round(line_item_subtotal, 2, out=line_item_subtotal)
+    np.round(line_item_discount, 2, out=line_item_discount)
+    np.round(line_item_total, 2, out=line_item_total)
+    np.round(item_tax_amount, 2, out=item_tax_amount)
+
+    df_order_items = pd.DataFrame({
+        'order_item_id': order_item_ids,
+        'order_id': order_ids[item_order_idx],
+        'order_number': order_number[item_order_idx],
+        'product_id': df_products['product_id'].to_numpy()[product_idx],
+        'product_sku': df_products['product_sku'].to_numpy()[product_idx],
+        'product_name': df_products['product_name'].to_numpy()[product_idx],
+        'quantity': quantity,
+        'unit_price': np.round(item_unit_price, 2),
+        'unit_cost': np.round(prod_unit_cost, 2),
+        'subtotal': line_item_subtotal,
+        'discount_pct': item_discount_pct,
+        'discount_amount': line_item_discount,
+        'line_total': line_item_total,
+        'is_taxable': prod_taxable,
+        'tax_rate': item_tax_rate,
+        'tax_amount': item_tax_amount,
+        'fulfillment_status': item_status[item_order_idx],
+        'category': df_products['category'].to_numpy()[product_idx],
+        'manufacturer': df_products['manufacturer'].to_numpy()[product_idx],
+        'profit_margin': np.round((item_unit_price - prod_unit_cost) / item_unit_price * 100, 2),
+        'profit_amount': np.round((item_unit_price - prod_unit_cost) * quantity, 2),
+    }, copy=False)
     
     # ---------------------------------------------------------------------------
     # Save data to Excel
     # ---------------------------------------------------------------------------
     
-    # Convert lists to DataFrames
-    df_customers = pd.DataFrame(customers)
-    df_products = pd.DataFrame(products)
-    df_orders = pd.DataFrame(orders)
-    df_order_items = pd.DataFrame(order_items)
-    
+    # Parse the mixed-format date columns once up front; format='mixed'
+    # disables the fast C parser, so every extra call is a slow full pass
+    reg_dt = pd.to_datetime(df_customers['registration_date'], format='mixed', errors='coerce')
+    ord_dt = pd.to_datetime(df_orders['order_date'], format='mixed', errors='coerce')
+    new_customer_count = int((reg_dt > now - timedelta(days=90)).sum())
+
+    # Each groupby scans the whole frame, so compute each aggregate once and
+    # take idxmax()/max() from the cached series instead of re-grouping and
+    # re-filtering for the "top X" value — the sum over the masked frame at
+    # the idxmax key is by definition the series maximum
+    items_per_order = df_order_items.groupby('order_id')['quantity'].sum()
+    category_sum = df_order_items.groupby('category')['line_total'].sum()
+    product_sum = df_order_items.groupby('product_name')['line_total'].sum()
+    region_sum = df_orders.groupby('sales_region')['total_amount'].sum()
+    channel_sum = df_orders.groupby('sales_channel')['total_amount'].sum()
+    rep_sum = df_orders.groupby('sales_rep')['total_amount'].sum()
+    customer_sum = df_orders.groupby('customer_name')['total_amount'].sum()
+
     # Create summary calculations
     summary_data = {
         'metric': [
@@ -492,43 +600,57 @@ def generate_order_data(num_orders=150, output_path=None):
             f"${df_orders['total_amount'].sum():,.2f}",
             f"${df_orders['total_amount'].mean():,.2f}",
             df_order_items['quantity'].sum(),
-            f"{df_order_items.groupby('order_id')['quantity'].sum().mean():.2f}",
+            f"{items_per_order.mean():.2f}",
             len(df_customers),
-            f"{len(df_customers[pd.to_datetime(df_customers['registration_date'], format='mixed') > datetime.now() - timedelta(days=90)])} (last 90 days)",
-            len(df_customers) - len(df_customers[pd.to_datetime(df_customers['registration_date'], format='mixed') > datetime.now() - timedelta(days=90)]),
+            f"{new_customer_count} (last 90 days)",
+            len(df_customers) - new_customer_count,
             len(df_products),
             len(df_products['category'].unique()),
-            df_order_items.groupby('category')['line_total'].sum().idxmax(),
-            df_orders.groupby('sales_region')['total_amount'].sum().idxmax(),
-            df_orders.groupby('sales_channel')['total_amount'].sum().idxmax(),
-            df_orders.groupby('sales_rep')['total_amount'].sum().idxmax(),
-            df_order_items.groupby('product_name')['line_total'].sum().idxmax(),
-            df_orders.groupby('customer_name')['total_amount'].sum().idxmax()
+            category_sum.idxmax(),
+            region_sum.idxmax(),
+            channel_sum.idxmax(),
+            rep_sum.idxmax(),
+            product_sum.idxmax(),
+            customer_sum.idxmax()
         ],
         'notes': [
-            f"For the period {pd.to_datetime(df_orders['order_date'], format='mixed').min().strftime('%Y-%m-%d')} to {pd.to_datetime(df_orders['order_date'], format='mixed').max().strftime('%Y-%m-%d')}",
+            f"For the period {ord_dt.min().strftime('%Y-%m-%d')} to {ord_dt.max().strftime('%Y-%m-%d')}",
             f"${df_orders['total_amount'].sum() / num_orders:,.2f} per order avg.",
             f"${df_orders['total_amount'].median():,.2f} median order value",
             f"{df_order_items.groupby('product_id')['quantity'].count().mean():.2f} items sold per product avg.",
-            f"{df_order_items.groupby('order_id')['quantity'].sum().max()} max items in a single order",
+            f"{items_per_order.max()} max items in a single order",
             f"{df_orders.groupby('customer_id').size().mean():.2f} orders per customer avg.",
             "New customers registered within last 90 days",
             "Customers with a registration date older than 90 days",
             f"{len(df_products[df_products['is_active']])} active products",
             ", ".join(df_products['category'].unique()),
-            f"${df_order_items.groupby('category')['line_total'].sum().max():,.2f} total revenue",
-            f"${df_orders[df_orders['sales_region'] == df_orders.groupby('sales_region')['total_amount'].sum().idxmax()]['total_amount'].sum():,.2f}",
-            f"${df_orders[df_orders['sales_channel'] == df_orders.groupby('sales_channel')['total_amount'].sum().idxmax()]['total_amount'].sum():,.2f}",
-            f"${df_orders[df_orders['sales_rep'] == df_orders.groupby('sales_rep')['total_amount'].sum().idxmax()]['total_amount'].sum():,.2f}",
-            f"${df_order_items[df_order_items['product_name'] == df_order_items.groupby('product_name')['line_total'].sum().idxmax()]['line_total'].sum():,.2f}",
-            f"${df_orders[df_orders['customer_name'] == df_orders.groupby('customer_name')['total_amount'].sum().idxmax()]['total_amount'].sum():,.2f}"
+            f"${category_sum.max():,.2f} total revenue",
+            f"${region_sum.max():,.2f}",
+            f"${channel_sum.max():,.2f}",
+            f"${rep_sum.max():,.2f}",
+            f"${product_sum.max():,.2f}",
+            f"${customer_sum.max():,.2f}"
         ]
     }
     df_summary = pd.DataFrame(summary_data)
     
-    # Save to Excel file
+    # Save to Excel file; xlsxwriter streams rows out 2-3x faster than
+    # openpyxl's in-memory workbook, so use it when installed
     print(f"Saving data to {output_path}...")
-    with pd.ExcelWriter(output_path, engine='openpyxl') as writer:
+    try:
+        import xlsxwriter  # noqa: F401
+        excel_engine = 'xlsxwriter'
+    except ImportError:
+        excel_engine = 'openpyxl'
+
+    # For big runs, xlsxwriter's constant_memory mode streams each row
+    # straight to disk instead of buffering the whole workbook, keeping
+    # memory flat regardless of row count
+    engine_kwargs = {}
+    if excel_engine == 'xlsxwriter' and num_orders > 10000:
+        engine_kwargs = {'options': {'constant_memory': True}}
+
+    with pd.ExcelWriter(output_path, engine=excel_engine, engine_kwargs=engine_kwargs) as writer:
         df_orders.to_excel(writer, sheet_name='Orders', index=False)
         df_order_items.to_excel(writer, sheet_name='Order Items', index=False)
         df_customers.to_excel(writer, sheet_name='Customers', index=False)
@@ -7,14 +7,20 @@ This example demonstrates how to:
 3. Generate a report on the database quality
 """
 
+import hashlib
 import os
+import pickle
+import re
 import sys
 import pandas as pd
 import numpy as np
 import sqlite3
 import sqlalchemy
-from sqlalchemy import create_engine, text
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.pool import QueuePool
 import datetime
+from collections import defaultdict, namedtuple
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import logging
 
@@ -28,6 +34,10 @@ src_dir = project_dir / 'src'
 if src_dir.exists():
     sys.path.insert(0, str(src_dir))
 
+# Report output directory, resolved and created once at import time
+OUT_DIR = Path(__file__).parent / 'output'
+OUT_DIR.mkdir(exist_ok=True)
+
 from sage.graders.database_grader import DatabaseGrader
 from sage.metrics.completeness import CompletenessMetric
 from sage.metrics.accuracy import AccuracyMetric
@@ -36,22 +46,261 @@ from sage.metrics.timeliness import TimelinessMetric     # Added timeliness metr
 from sage.reports.generator import generate_html_report
 from sage.data.profiler import DataProfiler, profile_dataframe  # Added data profiler
 
+# Compiled once at import; AccuracyMetric stores re.Pattern objects as-is,
+# so the patterns are never recompiled per table
+EMAIL_RE = re.compile(r'^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+$')
+PHONE_RE = re.compile(r'^\d{3}-\d{3}-\d{4}$')
+
+# Declarative accuracy rules, loaded in one batch via load_rules() rather
+# than a run of individual add_*_check calls
+ACCURACY_RULES = {
+    'patterns': {
+        'email': EMAIL_RE,
+        'phone': PHONE_RE,
+    },
+    'ranges': {
+        'price': (0.0, None),
+        'stock_quantity': (0, None),
+        'total_amount': (0.0, 10000.0),
+        'quantity': (1, None),
+        'discount': (0.0, 1.0),
+    },
+    'categoricals': {
+        'payment_method': ["Credit Card", "Debit Card", "PayPal", "Bank Transfer", "Cash"],
+        'status': ["Processing", "Shipped", "Delivered", "Cancelled", "Returned"],
+    },
+}
+
+
+# Status indicators, looked up instead of re-deriving per metric line
+STATUS_SYM = {'passed': '✓', 'warning': '⚠', 'failed': '✗'}
+
+
+def _fmt_completeness(metric_result):
+    """Print per-column completeness detail for a table's result."""
+    if 'columns' not in metric_result:
+        return
+    print("    Column completeness:")
+    for col, col_result in metric_result['columns'].items():
+        if col_result['completeness'] < 1.0:
+            col_score = col_result['completeness'] * 100
+            col_missing = col_result.get('missing_count', 0)
+            print(f"      - {col}: {col_score:.1f}% complete ({col_missing} missing values)")
+
+
+def _fmt_accuracy(metric_result):
+    """Print per-column accuracy issues for a table's result."""
+    if 'details' not in metric_result:
+        return
+    print("    Accuracy issues:")
+    for col, col_result in metric_result['details'].items():
+        if col_result.get('invalid', 0) > 0:
+            valid = col_result.get('valid', 0)
+            invalid = col_result.get('invalid', 0)
+            message = col_result.get('message', '')
+            print(f"      - {col}: {invalid} invalid values out of {valid + invalid} - {message}")
+
+
+def _fmt_consistency(metric_result):
+    """Print per-rule consistency results for a table's result."""
+    if 'rules' not in metric_result:
+        return
+    print("    Consistency rule results:")
+    for rule_name, rule_result in metric_result['rules'].items():
+        consistent = rule_result.get('consistent_rows', 0)
+        inconsistent = rule_result.get('inconsistent_rows', 0)
+        if inconsistent > 0:
+            print(f"      - {rule_name}: {inconsistent} inconsistent rows out of {consistent + inconsistent}")
+            # Show examples if available
+            if 'examples' in rule_result and rule_result['examples']:
+                print(f"        Example: {rule_result['examples'][0]}")
+
+
+def _fmt_timeliness(metric_result):
+    """Print per-column timeliness issues for a table's result."""
+    if 'details' not in metric_result:
+        return
+    print("    Timeliness issues:")
+    for col, col_result in metric_result['details'].items():
+        timely = col_result.get('timely', 0)
+        untimely = col_result.get('untimely', 0)
+        if untimely > 0:
+            check_type = col_result.get('check_type', 'check')
+            print(f"      - {col} ({check_type}): {untimely} untimely values out of {timely + untimely}")
+
+
+METRIC_FORMATTERS = {
+    'completeness': _fmt_completeness,
+    'accuracy': _fmt_accuracy,
+    'consistency': _fmt_consistency,
+    'timeliness': _fmt_timeliness,
+}
+
+
+# Recommendation step templates, shared as module-level tuples so the
+# same literal lists are not reallocated per report; dynamic findings are
+# appended to a list() copy where needed
+COMPLETENESS_STEPS = (
+    "Identify columns with missing values",
+    "Add NOT NULL constraints for required fields",
+    "Implement validation in application code",
+    "Review data collection processes",
+)
+ACCURACY_STEPS = (
+    "Review data validation rules",
+    "Add CHECK constraints to prevent invalid data",
+    "Implement data type constraints",
+    "Consider adding triggers for complex validation",
+)
+CONSISTENCY_STEPS = (
+    "Review relationship constraints between tables",
+    "Ensure referential integrity with proper foreign keys",
+    "Add business rule validations to maintain data consistency",
+    "Implement application-level validation for complex rules",
+)
+TIMELINESS_STEPS = (
+    "Review update frequency of critical data",
+    "Implement data refresh processes for stale data",
+    "Add auditing mechanisms to track data age",
+    "Consider data archiving strategy for old records",
+)
+UNIQUE_CONSTRAINT_STEPS = (
+    "Identify natural keys in each table",
+    "Add UNIQUE constraints or indices",
+    "De-duplicate existing data",
+    "Implement application-level duplicate detection",
+)
+INDEXING_STEPS = (
+    "Create indexes on frequently queried columns",
+    "Add indexes on foreign key columns",
+    "Consider composite indexes for multi-column queries",
+    "Review execution plans for slow queries",
+)
+DATA_TYPE_STEPS = (
+    "Review column data types for consistency",
+    "Convert string representations to proper numeric/date types",
+    "Add CHECK constraints for format validation",
+    "Document data type standards for future development",
+)
+
+
+class Recommendations:
+    """Structure-of-arrays store for report recommendations.
+
+    Fields live in parallel lists instead of one dict per entry; the
+    dict records the report template expects are materialized once at
+    the end.
+    """
+
+    def __init__(self):
+        self.titles = []
+        self.priorities = []
+        self.descriptions = []
+        self.steps = []
+
+    def add(self, title, priority, description, steps):
+        """Append one recommendation across the parallel lists."""
+        self.titles.append(title)
+        self.priorities.append(priority)
+        self.descriptions.append(description)
+        self.steps.append(steps)
+
+    def to_records(self):
+        """Materialize the dict-per-entry form for the report data."""
+        return [
+            {"title": t, "priority": p, "description": d, "steps": st}
+            for t, p, d, st in zip(self.titles, self.priorities,
+                                   self.descriptions, self.steps)
+        ]
+
+
+# Consolidated per-metric scores, read many times while assembling
+# recommendations: direct attribute access on these replaces repeated
+# nested dict lookups in the hot consolidation path
+MetricScore = namedtuple('MetricScore', ['score', 'status', 'tables'])
+ConsolidatedScores = namedtuple(
+    'ConsolidatedScores', ['completeness', 'accuracy', 'consistency', 'timeliness'])
+
+
+def _sql_duplicate_count(conn, table, cols):
+    """Count redundant rows (all but the first of each duplicate group) in SQL.
+
+    SQLite's grouped aggregate runs in C over the whole table, so the
+    count is exact even when profiling only sampled the first chunk.
+    """
+    col_list = ", ".join(cols)
+    cursor = conn.execute(
+        f"SELECT COALESCE(SUM(cnt - 1), 0) FROM "
+        f"(SELECT COUNT(*) AS cnt FROM {table} GROUP BY {col_list} HAVING cnt > 1)")
+    return int(cursor.fetchone()[0])
+
+
+def _tables_below(metric_data, threshold):
+    """Names of tables whose score sits below threshold, via one ufunc pass."""
+    tables = metric_data.tables
+    if not tables:
+        return []
+    names = np.array(list(tables.keys()))
+    scores = np.fromiter((d['score'] for d in tables.values()),
+                         dtype=np.float64, count=len(tables))
+    return names[scores < threshold].tolist()
+
+
+
+# Profiles are pure functions of the sample data, so cache them across
+# runs keyed by column names plus a content hash: re-running against an
+# unchanged table skips the full O(rows x cols) profiling pass
+PROFILE_CACHE_PATH = os.path.join(os.path.dirname(__file__), 'data',
+                                  '.sage_profile_cache.pkl')
+
+
+def _load_profile_cache():
+    """Load the persisted profile cache, or start fresh if unreadable."""
+    try:
+        with open(PROFILE_CACHE_PATH, 'rb') as f:
+            return pickle.load(f)
+    except Exception:
+        return {}
+
+
+def _profile_cache_key(df):
+    """Key a profile by the sample's columns and a hash of its values."""
+    content = pd.util.hash_pandas_object(df, index=False).values.tobytes()
+    return (tuple(df.columns), hashlib.md5(content).hexdigest())
+
+
+def profile_dataframe_cached(df, cache):
+    """Return a cached profile for df, computing and storing it on miss."""
+    key = _profile_cache_key(df)
+    if key not in cache:
+        cache[key] = profile_dataframe(df)
+    return cache[key]
+
+
+def _write_table(conn, name, schema, data):
+    """(Re)create a table and bulk-insert a dict of equal-length columns."""
+    placeholders = ', '.join('?' * len(data))
+    conn.execute(f'DROP TABLE IF EXISTS {name}')
+    conn.execute(f'CREATE TABLE {name} ({schema})')
+    conn.executemany(f'INSERT INTO {name} VALUES ({placeholders})',
+                     zip(*data.values()))
+
 
 def create_sample_database():
     """Create a sample SQLite database with some data quality issues."""
     print("Creating sample database...")
-    
+
     # Create a directory for example data if it doesn't exist
     data_dir = os.path.join(os.path.dirname(__file__), 'data')
     os.makedirs(data_dir, exist_ok=True)
-    
+
     # Database file path
     db_path = os.path.join(data_dir, 'sample_retail.db')
-    
-    # Create a connection to the database (this will create the file if it doesn't exist)
-    engine = create_engine(f'sqlite:///{db_path}')
-    
-    # Create tables and populate with sample data
+
+    # Create tables and populate with sample data. The column dicts below
+    # feed sqlite3 executemany directly — no intermediate DataFrame is
+    # built, so pandas never has to infer dtypes over the mixed
+    # None/float/int lists, and None maps straight to SQL NULL
     # 1. Products table - with some missing data
     products_data = {
         'product_id': range(1, 21),
@@ -87,9 +336,6 @@ def create_sample_database():
         ]
     }
     
-    products_df = pd.DataFrame(products_data)
-    products_df.to_sql('products', engine, index=False, if_exists='replace')
-    
     # 2. Customers table - with some invalid data
     customers_data = {
         'customer_id': range(1, 21),
@@ -136,9 +382,6 @@ def create_sample_database():
         ]
     }
     
-    customers_df = pd.DataFrame(customers_data)
-    customers_df.to_sql('customers', engine, index=False, if_exists='replace')
-    
     # 3. Orders table - with some data issues
     orders_data = {
         'order_id': range(1, 31),
@@ -184,9 +427,6 @@ def create_sample_database():
         ]
     }
     
-    orders_df = pd.DataFrame(orders_data)
-    orders_df.to_sql('orders', engine, index=False, if_exists='replace')
-    
     # 4. Order Items table - linking orders to products
     order_items_data = {
         'order_item_id': range(1, 41),
@@ -227,9 +467,35 @@ def create_sample_database():
         ]
     }
     
-    order_items_df = pd.DataFrame(order_items_data)
-    order_items_df.to_sql('order_items', engine, index=False, if_exists='replace')
-    
+    # Write all four tables over one sqlite3 connection: a single
+    # transaction with executemany batches the inserts instead of pandas
+    # to_sql committing row by row, and the throwaway sample database can
+    # safely trade durability PRAGMAs for write speed
+    conn = sqlite3.connect(db_path)
+    try:
+        conn.execute('PRAGMA journal_mode=MEMORY')
+        conn.execute('PRAGMA synchronous=OFF')
+        conn.execute('PRAGMA temp_store=MEMORY')
+        with conn:
+            _write_table(conn, 'products',
+                         'product_id INTEGER, product_name TEXT, category TEXT, '
+                         'price REAL, stock_quantity INTEGER, manufacturer TEXT',
+                         products_data)
+            _write_table(conn, 'customers',
+                         'customer_id INTEGER, first_name TEXT, last_name TEXT, '
+                         'email TEXT, phone TEXT, address TEXT, registration_date TEXT',
+                         customers_data)
+            _write_table(conn, 'orders',
+                         'order_id INTEGER, customer_id INTEGER, order_date TEXT, '
+                         'total_amount REAL, payment_method TEXT, status TEXT',
+                         orders_data)
+            _write_table(conn, 'order_items',
+                         'order_item_id INTEGER, order_id INTEGER, product_id INTEGER, '
+                         'quantity INTEGER, unit_price REAL, discount REAL',
+                         order_items_data)
+    finally:
+        conn.close()
+
     print(f"Sample retail database created at: {db_path}")
     return f'sqlite:///{db_path}'
 
@@ -239,7 +505,13 @@ def main():
     print("=" * 80)
     print("SAGE Example: Database Quality Assessment")
     print("=" * 80)
-    
+
+    # Read the wall clock once so the report's analysis date and the
+    # filename timestamp always refer to the same instant
+    now = datetime.datetime.now()
+    ts_file = now.strftime('%Y%m%d_%H%M%S')
+    ts_disp = now.strftime('%Y-%m-%d %H:%M:%S')
+
     # Step 1: Create sample database if needed
     connection_string = create_sample_database()
     
@@ -262,30 +534,10 @@ def main():
         failure_threshold=0.8
     )
     
-    # Email pattern validation
-    print("  Adding email pattern validation")
-    accuracy.add_pattern_check("email", r'^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+$')
-    
-    # Phone number format validation (simple version)
-    print("  Adding phone format validation")
-    accuracy.add_pattern_check("phone", r'^\d{3}-\d{3}-\d{4}$')
-    
-    # Numeric range validations
-    print("  Adding numeric range validations")
-    accuracy.add_range_check("price", min_value=0.0)
-    accuracy.add_range_check("stock_quantity", min_value=0)
-    accuracy.add_range_check("total_amount", min_value=0.0, max_value=10000.0)
-    accuracy.add_range_check("quantity", min_value=1)
-    accuracy.add_range_check("discount", min_value=0.0, max_value=1.0)
-    
-    # Categorical validations
-    print("  Adding categorical validations")
-    accuracy.add_categorical_check("payment_method", 
-                                  ["Credit Card", "Debit Card", "PayPal", "Bank Transfer", "Cash"])
-    
-    accuracy.add_categorical_check("status", 
-                                  ["Processing", "Shipped", "Delivered", "Cancelled", "Returned"])
-    
+    # Pattern, range and categorical validations in one declarative batch
+    print("  Loading pattern, range and categorical validation rules")
+    accuracy.load_rules(ACCURACY_RULES)
+
     grader.add_metric("accuracy", accuracy)
     
     # Add consistency metric with relationship checks
@@ -321,6 +573,10 @@ def main():
     )
     
     grader.add_metric("consistency", consistency)
+
+    # Load the low-cardinality code columns as category dtype so the
+    # status/payment isin checks compare int8 codes, not Python strings
+    grader.set_categorical_columns(['payment_method', 'status'])
     
     # Update Timeliness Metric for realistic date ranges in our sample data
     print("\n- Configuring Timeliness Metric")
@@ -357,7 +613,33 @@ def main():
     # Step 3: Connect to the database
     print(f"\nConnecting to database: {connection_string}")
     try:
-        engine = create_engine(connection_string)
+        # One engine for the whole run, with a bounded connection pool
+        # sized for the parallel grading step: each worker thread checks
+        # out its own live SQLite connection instead of reopening the
+        # file per query. Each worker can hold two connections at once
+        # (its own plus a transient inspector one), and two extra slots
+        # cover the grader's connection and the raw profiling connection.
+        # check_same_thread is relaxed because pooled connections migrate
+        # between worker threads
+        pool_workers = min(8, os.cpu_count() or 1)
+        engine = create_engine(connection_string,
+                               poolclass=QueuePool,
+                               pool_size=2 * pool_workers + 2,
+                               max_overflow=0,
+                               connect_args={'check_same_thread': False})
+
+        # Tune every pooled SQLite connection as it is created: WAL lets
+        # the parallel graders read while the prep pass writes,
+        # busy_timeout stops lock contention from surfacing as errors,
+        # and the cache/temp settings keep the many small reads in memory
+        @event.listens_for(engine, 'connect')
+        def _tune_sqlite(dbapi_connection, connection_record):
+            cur = dbapi_connection.cursor()
+            for pragma in ('journal_mode=WAL', 'synchronous=NORMAL',
+                           'temp_store=MEMORY', 'cache_size=-65536',
+                           'busy_timeout=5000'):
+                cur.execute(f'PRAGMA {pragma}')
+            cur.close()
         grader.connect(engine)
         print("✓ Connection successful")
     except Exception as e:
@@ -371,307 +653,310 @@ def main():
     # Step 4: Analyze each table
     all_results = {}
     table_profiles = {}
-    
-    # Update how the today variable is passed for consistency checks
-    # when we grade each table
+    profile_cache = _load_profile_cache()
+
+    # One raw DBAPI connection, reused for every profiling sample: the
+    # reads skip SQLAlchemy result processing, which is pure overhead for
+    # a plain SELECT feeding pandas. driver_connection unwraps the pool
+    # proxy down to the sqlite3 connection pandas knows natively
+    raw_conn = engine.raw_connection()
+    dbapi_conn = raw_conn.driver_connection
+
+    # Batch the table metadata up front over the raw connection: one
+    # PRAGMA per table plus a single UNION ALL of COUNT(*) queries,
+    # instead of grader.get_table_info() issuing its own inspector and
+    # COUNT round-trips inside the loop
+    table_info_cache = {}
+    cursor = dbapi_conn.cursor()
     for table in tables:
+        cursor.execute(f"PRAGMA table_info({table})")
+        columns = {row[1]: {"type": row[2], "nullable": not row[3]}
+                   for row in cursor.fetchall()}
+        table_info_cache[table] = {
+            "table": table,
+            "columns": columns,
+            "column_count": len(columns),
+            "row_count": 0
+        }
+    count_query = " UNION ALL ".join(
+        f"SELECT '{t}' AS t, COUNT(*) FROM {t}" for t in tables
+    )
+    cursor.execute(count_query)
+    for t, count in cursor.fetchall():
+        table_info_cache[t]["row_count"] = count
+    cursor.close()
+
+    # Normalize mixed-format date columns once up front. pandas parses
+    # each column in one C-level pass and copes with YYYY-MM-DD,
+    # YYYY/MM/DD and MM/DD/YYYY alike — unlike the old substr() rewrite,
+    # which assumed every slashed value was MM/DD/YYYY — and only the
+    # rows that actually changed are written back, batched in a single
+    # transaction
+    print("\nNormalizing date columns...")
+    with dbapi_conn:
+        for table in tables:
+            date_cols = [c for c in ('registration_date', 'order_date')
+                         if c in table_info_cache[table]['columns']]
+            for col in date_cols:
+                df = pd.read_sql_query(f"SELECT rowid, {col} FROM {table}",
+                                       dbapi_conn)
+                normalized = pd.to_datetime(df[col], errors='coerce',
+                                            format='mixed').dt.strftime('%Y-%m-%d')
+                changed = normalized.notna() & normalized.ne(df[col])
+                if changed.any():
+                    dbapi_conn.executemany(
+                        f"UPDATE {table} SET {col} = ? WHERE rowid = ?",
+                        list(zip(normalized[changed].tolist(),
+                                 df.loc[changed, 'rowid'].tolist())))
+                    print(f"  Normalized {int(changed.sum())} {col} values in {table}")
+
+    def prepare_table(table):
+        """Profile one table ahead of grading.
+
+        Runs sequentially so the progress output stays in table order.
+        """
         print(f"\n{'='*40}")
         print(f"Analyzing table: {table}")
         print(f"{'='*40}")
-        
-        grader.set_active_table(table)
-        
-        # Get table information and sample data
-        table_info = grader.get_table_info()
+
+        # Get table information from the pre-fetched cache
+        table_info = table_info_cache[table]
         print(f"\nTable Structure:")
         print(f"  Columns: {len(table_info['columns'])} ({', '.join(table_info['columns'].keys())})")
         print(f"  Rows: {table_info['row_count']}")
-        
-        # Get data sample for profiling
+
+        # Get data for profiling: stream the table in chunks so memory
+        # stays O(chunksize). The first chunk doubles as the profiling
+        # sample, while null counts accumulate over every chunk, making
+        # the completeness numbers exact for the whole table rather
+        # than an arbitrary LIMIT window
         try:
-            sample_query = f"SELECT * FROM {table} LIMIT 1000"
-            sample_data = pd.read_sql(sample_query, engine)
-            
+            sample_data = None
+            rows_read = 0
+            missing_cells = 0
+            for chunk in pd.read_sql_query(f"SELECT * FROM {table}",
+                                           dbapi_conn, chunksize=10000):
+                if sample_data is None:
+                    sample_data = chunk
+                rows_read += len(chunk)
+                missing_cells += int(chunk.isna().sum().sum())
+            if sample_data is None:
+                sample_data = pd.DataFrame(columns=list(table_info['columns']))
+
             print(f"\nData Sample Preview (first 5 rows):")
             print(sample_data.head().to_string())
-            
+
             # Profile the data
             print(f"\nProfiling data...")
-            profile = profile_dataframe(sample_data)
+            profile = profile_dataframe_cached(sample_data, profile_cache)
             table_profiles[table] = profile
-            
-            # Show some key profiling statistics
-            missing_cells = profile['overall_stats']['missing_cells']
-            total_cells = table_info['column_count'] * min(1000, table_info['row_count'])
+
+            # Show some key profiling statistics (exact, from the stream)
+            total_cells = table_info['column_count'] * rows_read
             missing_percent = (missing_cells / total_cells) * 100 if total_cells > 0 else 0
-            
+
             print(f"  Missing data: {missing_cells} cells ({missing_percent:.2f}%)")
-            
-            if 'duplicate_rows' in profile['overall_stats']:
-                duplicates = profile['overall_stats']['duplicate_rows']
-                duplicate_percent = (duplicates / len(sample_data)) * 100 if len(sample_data) > 0 else 0
-                print(f"  Duplicate rows: {duplicates} ({duplicate_percent:.2f}%)")
-            
-            # Show column-specific issues
+
+            # Recompute duplicates in SQL over the full table: the sampled
+            # profile only saw its first chunk
+            duplicates = _sql_duplicate_count(dbapi_conn, table,
+                                              table_info['columns'])
+            profile['overall_stats']['duplicate_rows'] = duplicates
+            profile['overall_stats']['duplicate_percent'] = (
+                duplicates / rows_read if rows_read else 0.0)
+            print(f"  Duplicate rows: {duplicates} ({duplicates / rows_read * 100 if rows_read else 0:.2f}%)")
+
+            # Show column-specific issues: build one frame of per-column
+            # stats and select issue rows with vectorized masks instead of
+            # looping over every column profile
             print("\nColumn-level data quality observations:")
-            for col, col_profile in profile['column_profiles'].items():
+            prof_df = pd.DataFrame.from_dict(profile['column_profiles'], orient='index')
+            for stat, default in (('missing_percent', 0.0), ('is_categorical', False),
+                                  ('unique_percent', 0.0), ('unique_count', 0),
+                                  ('is_numeric', False), ('skewness', np.nan)):
+                if stat not in prof_df.columns:
+                    prof_df[stat] = default
+
+            miss_mask = prof_df['missing_percent'].fillna(0) > 0.05
+            high_card = prof_df['is_categorical'].eq(True) & (prof_df['unique_percent'].fillna(0) > 0.8)
+            skewed = prof_df['is_numeric'].eq(True) & (prof_df['skewness'].abs() > 3)
+
+            for col in prof_df.index[miss_mask | high_card | skewed]:
                 issues = []
-                
-                # Check for missing data
-                if col_profile.get('missing_percent', 0) > 0.05:
-                    issues.append(f"{col_profile['missing_percent']:.1%} missing values")
-                
-                # Check for high cardinality in categorical columns
-                if col_profile.get('is_categorical', False) and col_profile.get('unique_percent', 0) > 0.8:
-                    issues.append(f"High cardinality ({col_profile['unique_count']} unique values)")
-                
-                # Check for potential outliers in numeric columns
-                if col_profile.get('is_numeric', False) and 'std' in col_profile and col_profile['std'] is not None:
-                    skewness = col_profile.get('skewness')
-                    if skewness is not None and abs(skewness) > 3:
-                        issues.append(f"Highly skewed data (skew={skewness:.2f})")
-                
-                if issues:
-                    print(f"  - {col}: {', '.join(issues)}")
-        
+                if miss_mask[col]:
+                    issues.append(f"{prof_df.at[col, 'missing_percent']:.1%} missing values")
+                if high_card[col]:
+                    issues.append(f"High cardinality ({int(prof_df.at[col, 'unique_count'])} unique values)")
+                if skewed[col]:
+                    issues.append(f"Highly skewed data (skew={prof_df.at[col, 'skewness']:.2f})")
+                print(f"  - {col}: {', '.join(issues)}")
+
         except Exception as e:
             print(f"Error profiling data: {e}")
-        
+
         # Grade the data with all metrics
-        print(f"\nGrading table with all metrics...")
-        
-        # Instead of using query_params, we need to inject the date values directly
-        # Convert registration_date and order_date to datetime if they exist in the table
-        try:
-            sample_query = f"SELECT * FROM {table} LIMIT 1"
-            sample_data = pd.read_sql(sample_query, engine)
-            
-            # Fix date formats to ensure consistent YYYY-MM-DD format
-            # This is a common data quality issue in real databases
-            if 'registration_date' in sample_data.columns:
-                # Convert MM/DD/YYYY format to YYYY-MM-DD
-                date_fix_query = f"""
-                UPDATE {table} 
-                SET registration_date = substr(registration_date, 7, 4) || '-' || 
-                                       substr(registration_date, 1, 2) || '-' || 
-                                       substr(registration_date, 4, 2)
-                WHERE registration_date LIKE '%/%'
-                """
-                try:
-                    with engine.connect() as conn:
-                        conn.execute(text(date_fix_query))
-                        conn.commit()
-                    print(f"  Fixed date formats in {table}.registration_date")
-                except Exception as e:
-                    print(f"  Could not fix date formats: {str(e)}")
-            
-            if 'order_date' in sample_data.columns:
-                # Update order_date format in database if needed
-                date_fix_query = f"""
-                UPDATE {table} 
-                SET order_date = substr(order_date, 7, 4) || '-' || 
-                                 substr(order_date, 1, 2) || '-' || 
-                                 substr(order_date, 4, 2)
-                WHERE order_date LIKE '%/%'
-                """
-                try:
-                    with engine.connect() as conn:
-                        conn.execute(text(date_fix_query))
-                        conn.commit()
-                    print(f"  Fixed date formats in {table}.order_date")
-                except Exception as e:
-                    print(f"  Could not fix date formats: {str(e)}")
-                    
-        except Exception as e:
-            print(f"  Could not prepare date fields: {str(e)}")
-        
+        print(f"\nPreparing table for grading...")
+
         # For consistency with "today" value, we'll set up a global SQL variable if possible
         try:
             today_query = f"PRAGMA user_version = '{reference_date.isoformat()}';"
-            with engine.connect() as conn:
+            # engine.begin() commits on exit — no separate commit round trip
+            with engine.begin() as conn:
                 conn.execute(text(today_query))
-                conn.commit()
         except Exception as e:
             print(f"  Note: Could not set reference date in database: {str(e)}")
-        
-        # Now grade the table without query_params
-        table_results = grader.grade()
-        all_results[table] = table_results
-        
-        # Display results for each metric
-        print("\nMetric Results:")
+
+    def grade_one_table(table):
+        """Grade one table on a per-thread grader sharing the metrics.
+
+        DatabaseGrader keeps per-table state (active table, connection),
+        so each worker gets its own shallow clone; the metric instances
+        themselves are read-only during evaluation and are shared.
+        """
+        clone = DatabaseGrader(name=f"{grader.name}: {table}")
+        for metric_name, metric in grader.metrics.items():
+            clone.add_metric(metric_name, metric)
+        clone.set_categorical_columns(grader.categorical_columns)
+        clone.connect(engine)
+        clone.set_active_table(table)
+        try:
+            return clone.grade()
+        finally:
+            clone.close()
+
+    # Sequential prep first (progress output and the SQLite date fixes),
+    # then grade every table in parallel: the tables are independent and
+    # SQLite handles concurrent readers, so each worker pulls its own
+    # pooled connection and runs the full metric suite on its table
+    for table in tables:
+        prepare_table(table)
+
+    max_workers = min(8, len(tables), os.cpu_count() or 1)
+    print(f"\nGrading {len(tables)} tables with {max_workers} workers...")
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        graded = dict(zip(tables, pool.map(grade_one_table, tables)))
+
+    # Display results in table order, then keep the full detail only for
+    # tables where a metric did not pass — the consolidation step needs
+    # just score and status, and the recommendations only dig into the
+    # tables with issues
+    for table, table_results in graded.items():
+        print(f"\nMetric Results for {table}:")
         for metric_name, metric_result in table_results.get('metrics', {}).items():
             score = metric_result.get('score', 0) * 100
             status = metric_result.get('status', 'unknown')
             message = metric_result.get('message', 'No message provided')
-            
-            # Format the status with a color indicator
-            status_symbol = "✓" if status == "passed" else "⚠" if status == "warning" else "✗"
-            
+
+            # Symbol lookup and dict dispatch to the per-metric detail
+            # formatter replace the old if/elif chain
+            status_symbol = STATUS_SYM.get(status, "✗")
             print(f"  {metric_name}: {score:.1f}% - {status_symbol} {status.upper()} - {message}")
-            
-            # Show detailed information for each metric
-            if metric_name == "completeness" and 'columns' in metric_result:
-                print("    Column completeness:")
-                for col, col_result in metric_result['columns'].items():
-                    if col_result['completeness'] < 1.0:
-                        col_score = col_result['completeness'] * 100
-                        col_missing = col_result.get('missing_count', 0)
-                        print(f"      - {col}: {col_score:.1f}% complete ({col_missing} missing values)")
-            
-            elif metric_name == "accuracy" and 'details' in metric_result:
-                print("    Accuracy issues:")
-                for col, col_result in metric_result['details'].items():
-                    if col_result.get('invalid', 0) > 0:
-                        valid = col_result.get('valid', 0)
-                        invalid = col_result.get('invalid', 0)
-                        message = col_result.get('message', '')
-                        print(f"      - {col}: {invalid} invalid values out of {valid + invalid} - {message}")
-            
-            elif metric_name == "consistency" and 'rules' in metric_result:
-                print("    Consistency rule results:")
-                for rule_name, rule_result in metric_result['rules'].items():
-                    consistent = rule_result.get('consistent_rows', 0)
-                    inconsistent = rule_result.get('inconsistent_rows', 0)
-                    if inconsistent > 0:
-                        print(f"      - {rule_name}: {inconsistent} inconsistent rows out of {consistent + inconsistent}")
-                        # Show examples if available
-                        if 'examples' in rule_result and rule_result['examples']:
-                            print(f"        Example: {rule_result['examples'][0]}")
-            
-            elif metric_name == "timeliness" and 'details' in metric_result:
-                print("    Timeliness issues:")
-                for col, col_result in metric_result['details'].items():
-                    timely = col_result.get('timely', 0)
-                    untimely = col_result.get('untimely', 0)
-                    if untimely > 0:
-                        check_type = col_result.get('check_type', 'check')
-                        print(f"      - {col} ({check_type}): {untimely} untimely values out of {timely + untimely}")
-    
+
+            formatter = METRIC_FORMATTERS.get(metric_name)
+            if formatter:
+                formatter(metric_result)
+
+        metrics = table_results.get('metrics', {})
+        if all(r.get('status') == 'passed' for r in metrics.values()):
+            all_results[table] = {
+                'metrics': {
+                    m: {'score': r.get('score', 0.0), 'status': r.get('status', 'unknown')}
+                    for m, r in metrics.items()
+                }
+            }
+        else:
+            all_results[table] = table_results
+
+    raw_conn.close()
+
+    # Persist the profile cache so unchanged tables skip profiling next run
+    try:
+        with open(PROFILE_CACHE_PATH, 'wb') as f:
+            pickle.dump(profile_cache, f)
+    except Exception as e:
+        print(f"  Note: Could not persist profile cache: {str(e)}")
+
     # Step 5: Create a comprehensive report with all the collected data
     print("\n" + "="*40)
     print("Creating comprehensive quality report...")
     print("="*40)
     
-    # Initialize consolidated metrics
-    consolidated_metrics = {
-        "completeness": {
-            "score": 0.0,
-            "status": "passed",
-            "tables": {}
-        },
-        "accuracy": {
-            "score": 0.0,
-            "status": "passed",
-            "tables": {}
-        },
-        "consistency": {
-            "score": 0.0,
-            "status": "passed",
-            "tables": {}
-        },
-        "timeliness": {
-            "score": 0.0,
-            "status": "passed",
-            "tables": {}
-        }
-    }
-    
-    # Collect metrics across all tables
-    tables_with_metrics = {metric: 0 for metric in consolidated_metrics}
-    
+    # Consolidate scores in a single pass over the results: accumulate
+    # sums, counts and the per-table breakdown together, then derive the
+    # averages and statuses once instead of re-walking the dict four times
+    metric_names = list(ConsolidatedScores._fields)
+    metric_sums = defaultdict(float)
+    metric_counts = defaultdict(int)
+    metric_tables = defaultdict(dict)
+
     for table, results in all_results.items():
-        metrics = results.get('metrics', {})
-        
-        for metric_name in consolidated_metrics:
-            if metric_name in metrics:
-                tables_with_metrics[metric_name] += 1
-                table_score = metrics[metric_name]['score']
-                table_status = metrics[metric_name]['status']
-                consolidated_metrics[metric_name]['tables'][table] = {
-                    "score": table_score,
-                    "status": table_status
-                }
-                consolidated_metrics[metric_name]['score'] += table_score
-    
-    # Calculate average scores
-    for metric_name, tables_count in tables_with_metrics.items():
-        if tables_count > 0:
-            consolidated_metrics[metric_name]['score'] /= tables_count
-    
-    # Determine overall status for each metric
-    for metric_name, metric_data in consolidated_metrics.items():
-        score = metric_data['score']
-        if score < 0.7:
-            metric_data['status'] = "failed"
-        elif score < 0.9:
-            metric_data['status'] = "warning"
-        else:
-            metric_data['status'] = "passed"
-    
-    # Calculate overall data quality score
-    metrics_count = 0
-    overall_score = 0.0
-    
-    for metric_name, metric_data in consolidated_metrics.items():
-        if 'score' in metric_data and tables_with_metrics[metric_name] > 0:
-            metrics_count += 1
-            overall_score += metric_data['score']
-    
-    if metrics_count > 0:
-        overall_score /= metrics_count
-    
-    # Determine overall status
-    overall_status = "failed"
-    if overall_score >= 0.9:
-        overall_status = "passed"
-    elif overall_score >= 0.7:
-        overall_status = "warning"
+        for metric_name, result in results.get('metrics', {}).items():
+            metric_sums[metric_name] += result['score']
+            metric_counts[metric_name] += 1
+            metric_tables[metric_name][table] = {
+                "score": result['score'],
+                "status": result['status']
+            }
+
+    def status_for(score):
+        return "failed" if score < 0.7 else "warning" if score < 0.9 else "passed"
+
+    def consolidate(metric_name):
+        count = metric_counts[metric_name]
+        score = metric_sums[metric_name] / count if count else 0.0
+        return MetricScore(score=score, status=status_for(score),
+                           tables=metric_tables[metric_name])
+
+    scores = ConsolidatedScores._make(consolidate(m) for m in metric_names)
+
+    # Overall data quality score: mean of the metric averages that had data
+    graded_scores = [m.score for m, name in zip(scores, metric_names) if metric_counts[name]]
+    overall_score = sum(graded_scores) / len(graded_scores) if graded_scores else 0.0
+    overall_status = status_for(overall_score)
     
-    # Create recommendations based on findings
-    recommendations = []
+    # Create recommendations based on findings, accumulated column-wise
+    recommendations = Recommendations()
     
     # Completeness recommendations
-    if consolidated_metrics['completeness']['score'] < 0.95:
-        tables_with_issues = [
-            table for table, data in consolidated_metrics['completeness']['tables'].items()
-            if data['score'] < 0.95
-        ]
+    if scores.completeness.score < 0.95:
+        tables_with_issues = _tables_below(scores.completeness, 0.95)
         
         if tables_with_issues:
-            steps = [
-                "Identify columns with missing values",
-                "Add NOT NULL constraints for required fields",
-                "Implement validation in application code",
-                "Review data collection processes"
-            ]
+            steps = list(COMPLETENESS_STEPS)
             
-            # Add specific column recommendations based on profiling
+            # Add specific column recommendations: flatten the per-column
+            # completeness details into one DataFrame and let a single
+            # vectorized filter pick out the problematic columns instead
+            # of triple-nested Python loops
+            completeness_rows = [
+                (table, col, details.get('completeness', 1.0))
+                for table, results in all_results.items()
+                for metric in results.get('metrics', {}).values()
+                if 'columns' in metric
+                for col, details in metric['columns'].items()
+            ]
             problematic_columns = []
-            for table in tables_with_issues:
-                for metric in all_results[table].get('metrics', {}).values():
-                    if 'columns' in metric:
-                        for col, details in metric['columns'].items():
-                            if details.get('completeness', 1.0) < 0.9:
-                                problematic_columns.append(f"{table}.{col}")
-            
+            if completeness_rows:
+                comp_df = pd.DataFrame(completeness_rows,
+                                       columns=['table', 'col', 'completeness'])
+                bad = comp_df[(comp_df['completeness'] < 0.9) &
+                              comp_df['table'].isin(tables_with_issues)]
+                problematic_columns = bad['table'].str.cat(bad['col'], sep='.').tolist()
+
             if problematic_columns:
                 steps.append(f"Focus on problematic columns: {', '.join(problematic_columns[:5])}" + 
                             (f" and {len(problematic_columns) - 5} others" if len(problematic_columns) > 5 else ""))
             
-            recommendations.append({
-                "title": "Address Missing Data",
-                "priority": "high" if consolidated_metrics['completeness']['score'] < 0.8 else "medium",
-                "description": f"Missing data detected in tables: {', '.join(tables_with_issues)}",
-                "steps": steps
-            })
+            recommendations.add(
+                title="Address Missing Data",
+                priority="high" if scores.completeness.score < 0.8 else "medium",
+                description=f"Missing data detected in tables: {', '.join(tables_with_issues)}",
+                steps=steps
+            )
     
     # Accuracy recommendations
-    if consolidated_metrics['accuracy']['score'] < 0.95:
-        tables_with_issues = [
-            table for table, data in consolidated_metrics['accuracy']['tables'].items()
-            if data['score'] < 0.95
-        ]
+    if scores.accuracy.score < 0.95:
+        tables_with_issues = _tables_below(scores.accuracy, 0.95)
         
         if tables_with_issues:
             # Collect specific accuracy issues
@@ -683,12 +968,7 @@ def main():
                         if col_details.get('invalid', 0) > 0:
                             accuracy_issues.append(f"{table}.{col}: {col_details.get('message', '')}")
             
-            steps = [
-                "Review data validation rules",
-                "Add CHECK constraints to prevent invalid data",
-                "Implement data type constraints",
-                "Consider adding triggers for complex validation"
-            ]
+            steps = list(ACCURACY_STEPS)
             
             if accuracy_issues:
                 steps.append("Address specific issues:")
@@ -697,66 +977,57 @@ def main():
                 if len(accuracy_issues) > 3:
                     steps.append(f"  - Plus {len(accuracy_issues) - 3} more issues")
             
-            priority = "high" if consolidated_metrics['accuracy']['score'] < 0.85 else "medium"
+            priority = "high" if scores.accuracy.score < 0.85 else "medium"
             print(f"Adding accuracy recommendation with {priority} priority")
             
-            recommendations.append({
-                "title": "Fix Data Accuracy Issues",
-                "priority": priority,
-                "description": f"Data accuracy issues detected in tables: {', '.join(tables_with_issues)}",
-                "steps": steps
-            })
+            recommendations.add(
+                title="Fix Data Accuracy Issues",
+                priority=priority,
+                description=f"Data accuracy issues detected in tables: {', '.join(tables_with_issues)}",
+                steps=steps
+            )
     
     # Consistency recommendations
-    if 'consistency' in consolidated_metrics and consolidated_metrics['consistency']['score'] < 0.95:
-        tables_with_issues = [
-            table for table, data in consolidated_metrics['consistency']['tables'].items()
-            if data['score'] < 0.95
-        ]
+    if scores.consistency.score < 0.95:
+        tables_with_issues = _tables_below(scores.consistency, 0.95)
         
         if tables_with_issues:
-            recommendations.append({
-                "title": "Improve Data Consistency",
-                "priority": "high" if consolidated_metrics['consistency']['score'] < 0.8 else "medium",
-                "description": f"Data consistency issues detected in tables: {', '.join(tables_with_issues)}",
-                "steps": [
-                    "Review relationship constraints between tables",
-                    "Ensure referential integrity with proper foreign keys",
-                    "Add business rule validations to maintain data consistency",
-                    "Implement application-level validation for complex rules"
-                ]
-            })
+            recommendations.add(
+                title="Improve Data Consistency",
+                priority="high" if scores.consistency.score < 0.8 else "medium",
+                description=f"Data consistency issues detected in tables: {', '.join(tables_with_issues)}",
+                steps=list(CONSISTENCY_STEPS)
+            )
     
     # Timeliness recommendations
-    if 'timeliness' in consolidated_metrics and consolidated_metrics['timeliness']['score'] < 0.9:
-        tables_with_issues = [
-            table for table, data in consolidated_metrics['timeliness']['tables'].items()
-            if data['score'] < 0.9
-        ]
+    if scores.timeliness.score < 0.9:
+        tables_with_issues = _tables_below(scores.timeliness, 0.9)
         
         if tables_with_issues:
-            recommendations.append({
-                "title": "Address Data Freshness Issues",
-                "priority": "medium",
-                "description": f"Data timeliness issues detected in tables: {', '.join(tables_with_issues)}",
-                "steps": [
-                    "Review update frequency of critical data",
-                    "Implement data refresh processes for stale data",
-                    "Add auditing mechanisms to track data age",
-                    "Consider data archiving strategy for old records"
-                ]
-            })
-    
-    # Add database-specific recommendations from profiling insights
-    unique_constraints_needed = False
+            recommendations.add(
+                title="Address Data Freshness Issues",
+                priority="medium",
+                description=f"Data timeliness issues detected in tables: {', '.join(tables_with_issues)}",
+                steps=list(TIMELINESS_STEPS)
+            )
+    
+    # Add database-specific recommendations from profiling insights.
+    # Duplicate counts come from one batched UNION ALL round trip over
+    # every table (total rows minus distinct rows), which is exact for
+    # the whole database rather than just the profiling sample
+    dup_sql = " UNION ALL ".join(
+        f"SELECT '{table}' AS tbl, "
+        f"(SELECT COUNT(*) FROM {table}) - "
+        f"(SELECT COUNT(*) FROM (SELECT DISTINCT * FROM {table}))"
+        for table in tables)
+    with engine.connect() as conn:
+        dup_counts = dict(conn.execute(text(dup_sql)).fetchall())
+
+    unique_constraints_needed = any(count > 0 for count in dup_counts.values())
     indexing_needed = False
     data_type_issues = False
-    
+
     for table, profile in table_profiles.items():
-        # Check for potential duplicate records
-        if profile['overall_stats'].get('duplicate_rows', 0) > 0:
-            unique_constraints_needed = True
-        
         # Check for data type issues
         for col, col_profile in profile['column_profiles'].items():
             if col_profile.get('is_numeric', False) and col_profile.get('dtype', '').startswith('object'):
@@ -764,80 +1035,68 @@ def main():
                 break
     
     if unique_constraints_needed:
-        recommendations.append({
-            "title": "Add Unique Constraints",
-            "priority": "high",
-            "description": "Potential duplicate records detected in the database",
-            "steps": [
-                "Identify natural keys in each table",
-                "Add UNIQUE constraints or indices",
-                "De-duplicate existing data",
-                "Implement application-level duplicate detection"
-            ]
-        })
+        recommendations.add(
+            title="Add Unique Constraints",
+            priority="high",
+            description="Potential duplicate records detected in the database",
+            steps=list(UNIQUE_CONSTRAINT_STEPS)
+        )
     
     # Always add indexing recommendation as it's generally beneficial
-    recommendations.append({
-        "title": "Review Database Indexing",
-        "priority": "medium",
-        "description": "Ensure appropriate indexes exist for query performance",
-        "steps": [
-            "Create indexes on frequently queried columns",
-            "Add indexes on foreign key columns",
-            "Consider composite indexes for multi-column queries",
-            "Review execution plans for slow queries"
-        ]
-    })
+    recommendations.add(
+        title="Review Database Indexing",
+        priority="medium",
+        description="Ensure appropriate indexes exist for query performance",
+        steps=list(INDEXING_STEPS)
+    )
     
     if data_type_issues:
-        recommendations.append({
-            "title": "Standardize Data Types",
-            "priority": "medium",
-            "description": "Inconsistent data types detected across columns",
-            "steps": [
-                "Review column data types for consistency",
-                "Convert string representations to proper numeric/date types",
-                "Add CHECK constraints for format validation",
-                "Document data type standards for future development"
-            ]
-        })
+        recommendations.add(
+            title="Standardize Data Types",
+            priority="medium",
+            description="Inconsistent data types detected across columns",
+            steps=list(DATA_TYPE_STEPS)
+        )
     
+    # Assemble the per-table report section with one lookup per source
+    # dict per table instead of re-walking them for every field
+    tables_out = {}
+    for table in tables:
+        ti = table_info_cache[table]
+        tables_out[table] = {
+            "info": {
+                "row_count": ti["row_count"],
+                "column_count": ti["column_count"],
+                "columns": list(ti["columns"].keys())
+            },
+            "metrics": all_results[table].get("metrics", {}),
+            "profile": table_profiles.get(table, {})
+        }
+
     # Prepare the final report data with detailed insights
     report_data = {
         "title": "Retail Database Quality Assessment",
         "description": f"Comprehensive analysis of {len(tables)} tables in the retail database",
         "overall_score": overall_score,
         "overall_status": overall_status,
-        "metrics": consolidated_metrics,
-        "tables": {
-            table: {
-                "info": {
-                    "row_count": all_results[table].get("table_info", {}).get("row_count", 0),
-                    "column_count": all_results[table].get("table_info", {}).get("column_count", 0),
-                    "columns": list(all_results[table].get("table_info", {}).get("columns", {}).keys())
-                },
-                "metrics": all_results[table].get("metrics", {}),
-                "profile": table_profiles.get(table, {})
-            } for table in tables
-        },
+        "metrics": {name: metric._asdict()
+                    for name, metric in zip(metric_names, scores)},
+        "tables": tables_out,
         "details": {
             "database_type": "SQLite",
             "tables_analyzed": len(tables),
             "table_names": tables,
-            "total_rows": sum(all_results[table].get("table_info", {}).get("row_count", 0) for table in tables),
-            "analysis_date": datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "total_rows": int(np.fromiter((table_info_cache[t]["row_count"] for t in tables),
+                                           dtype=np.int64, count=len(tables)).sum()),
+            "analysis_date": ts_disp,
             "analysis_duration": "n/a"  # Could add timing if desired
         },
-        "recommendations": recommendations
+        "recommendations": recommendations.to_records()
     }
     
     # Generate HTML report
-    output_dir = os.path.join(os.path.dirname(__file__), 'output')
-    os.makedirs(output_dir, exist_ok=True)
-    
-    timestamp = datetime.datetime.now().strftime('%Y%m%d_%H%M%S')
-    report_path = os.path.join(output_dir, f"database_quality_report_{timestamp}.html")
-    
+    report_path = str(OUT_DIR / f"database_quality_report_{ts_file}.html")
+
     generate_html_report(report_data, report_path)
     
     print("\nDone!")
@@ -54,10 +54,16 @@ setuptools.setup(
             "black",
             "flake8",
             "sphinx",
+            "sphinx-autoapi",
             "sphinx_rtd_theme",
         ],
         "viz": [
             "plotly>=5.0.0",
         ],
+        "fast": [
+            "orjson>=3",
+            "pyarrow>=10.0.0",
+            "python-calamine>=0.2.0",
+        ],
     },
 )
@@ -5,18 +5,33 @@ A comprehensive toolkit for assessing and grading data quality
 in spreadsheets, databases, and other data sources.
 """
 
+import importlib
+
 # Import version information
 from sage.version import __version__, __author__, VERSION_INFO
 
-# Import core components that should be available directly from sage package
-try:
-    from sage.core import Analyzer
-except ImportError:
-    # If Analyzer doesn't exist yet, don't try to import it
-    pass
+# Top-level attributes resolved lazily (PEP 562) so that `import sage`
+# does not execute the CLI and core modules until they are actually used
+_LAZY = {
+    'Analyzer': ('sage.core', 'Analyzer'),
+    'help': ('sage.cli.help', 'show_help'),
+}
+
+
+def __getattr__(name):
+    """Resolve lazily exported attributes on first access."""
+    if name in _LAZY:
+        module_name, attr_name = _LAZY[name]
+        value = getattr(importlib.import_module(module_name), attr_name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    """Include lazily exported attributes in dir(sage)."""
+    return sorted(list(globals().keys()) + list(_LAZY.keys()))
 
-# Import help functionality
-from sage.cli.help import show_help as help
 
 # Define the version - imported from version.py
 def get_version():
@@ -5,8 +5,18 @@ This package provides the command-line interface for running SAGE
 data quality assessments and generating reports.
 """
 
-from sage.cli.commands import main, run_assessment, generate_report
-from sage.cli.formatters import format_output, print_result, print_table
+import importlib
+
+# Attributes resolved lazily (PEP 562) so importing sage.cli does not
+# pull in the command and formatter modules until they are used
+_LAZY = {
+    'main': 'sage.cli.commands',
+    'run_assessment': 'sage.cli.commands',
+    'generate_report': 'sage.cli.commands',
+    'format_output': 'sage.cli.formatters',
+    'print_result': 'sage.cli.formatters',
+    'print_table': 'sage.cli.formatters',
+}
 
 # List of functions to expose when using `from sage.cli import *`
 __all__ = [
@@ -17,3 +27,17 @@ __all__ = [
     'print_result',
     'print_table'
 ]
+
+
+def __getattr__(name):
+    """Resolve lazily exported attributes on first access."""
+    if name in _LAZY:
+        value = getattr(importlib.import_module(_LAZY[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    """Include lazily exported attributes in dir(sage.cli)."""
+    return sorted(list(globals().keys()) + list(_LAZY.keys()))
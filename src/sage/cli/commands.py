@@ -11,18 +11,46 @@ import argparse
 import logging
 import time
 from typing import Dict, List, Any, Optional, Tuple, Union
-import pandas as pd
 
 from sage.cli.formatters import format_output, print_result, print_table, print_banner
-from sage.data.loader import load_data
-from sage.core.analyzer import Analyzer
-from sage.reports.generator import generate_html_report
-from sage.config.settings import load_configuration
+
+# The data/analyzer/report modules (and pandas behind them) are imported
+# inside the commands that need them, so short invocations like
+# `sage version` or `--help` never pay their import cost
 
 # Set up logger
 logger = logging.getLogger("sage.cli")
 
 
+def _dump_json(obj: Dict[str, Any], path: str) -> None:
+    """Write obj to path as indented JSON, preferring orjson's C encoder.
+
+    The payload is encoded before the file is opened, so a serialization
+    error never truncates an existing output file.
+    """
+    try:
+        import orjson
+        payload = orjson.dumps(
+            obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+    except ImportError:
+        import json
+        payload = json.dumps(obj, indent=2).encode("utf-8")
+    with open(path, "wb") as f:
+        f.write(payload)
+
+
+def _load_json(path: str) -> Dict[str, Any]:
+    """Read JSON from path, preferring orjson's C parser."""
+    try:
+        import orjson
+        with open(path, "rb") as f:
+            return orjson.loads(f.read())
+    except ImportError:
+        import json
+        with open(path, "r") as f:
+            return json.load(f)
+
+
 def setup_logging(verbose: bool = False) -> None:
     """
     Set up logging configuration.
@@ -45,22 +73,8 @@ def setup_logging(verbose: bool = False) -> None:
     logging.getLogger("PIL").setLevel(logging.WARNING)
 
 
-def parse_args() -> argparse.Namespace:
-    """
-    Parse command line arguments.
-    
-    Returns:
-        Parsed arguments
-    """
-    parser = argparse.ArgumentParser(
-        description="SAGE - Spreadsheet Analysis Grading Engine",
-        formatter_class=argparse.ArgumentDefaultsHelpFormatter
-    )
-    
-    # Create subparsers for different commands
-    subparsers = parser.add_subparsers(dest="command", help="Command to execute")
-    
-    # Assess command
+def _add_assess_parser(subparsers) -> None:
+    """Register the assess subcommand."""
     assess_parser = subparsers.add_parser("assess", help="Assess data quality")
     assess_parser.add_argument(
         "file", 
@@ -90,8 +104,10 @@ def parse_args() -> argparse.Namespace:
         "--sheet",
         help="Sheet name for Excel files"
     )
-    
-    # Report command
+
+
+def _add_report_parser(subparsers) -> None:
+    """Register the report subcommand."""
     report_parser = subparsers.add_parser("report", help="Generate a report from assessment results")
     report_parser.add_argument(
         "results",
@@ -117,8 +133,10 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Enable verbose logging"
     )
-    
-    # Profile command
+
+
+def _add_profile_parser(subparsers) -> None:
+    """Register the profile subcommand."""
     profile_parser = subparsers.add_parser("profile", help="Profile a dataset")
     profile_parser.add_argument(
         "file",
@@ -142,10 +160,48 @@ def parse_args() -> argparse.Namespace:
         "--sheet",
         help="Sheet name for Excel files"
     )
-    
-    # Version command
-    version_parser = subparsers.add_parser("version", help="Show version information")
-    
+
+
+def _add_version_parser(subparsers) -> None:
+    """Register the version subcommand."""
+    subparsers.add_parser("version", help="Show version information")
+
+
+# Subcommand registrars, keyed by command name so parse_args can build
+# only the parser the invocation actually needs
+_SUBPARSER_BUILDERS = {
+    "assess": _add_assess_parser,
+    "report": _add_report_parser,
+    "profile": _add_profile_parser,
+    "version": _add_version_parser,
+}
+
+
+def parse_args() -> argparse.Namespace:
+    """
+    Parse command line arguments.
+
+    Returns:
+        Parsed arguments
+    """
+    parser = argparse.ArgumentParser(
+        description="SAGE - Spreadsheet Analysis Grading Engine",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter
+    )
+
+    # Create subparsers for different commands
+    subparsers = parser.add_subparsers(dest="command", help="Command to execute")
+
+    # Build only the subparser for the requested command; top-level help,
+    # no command, and unknown commands still get the full tree
+    command = sys.argv[1] if len(sys.argv) > 1 else None
+    builder = _SUBPARSER_BUILDERS.get(command)
+    if builder is not None:
+        builder(subparsers)
+    else:
+        for build in _SUBPARSER_BUILDERS.values():
+            build(subparsers)
+
     return parser.parse_args()
 
 
@@ -167,9 +223,13 @@ def run_assessment(file_path: str,
     Returns:
         Assessment results
     """
+    from sage.config.settings import load_configuration
+    from sage.core.analyzer import Analyzer
+    from sage.data.loader import load_data
+
     logger.info(f"Starting assessment of {file_path}")
     start_time = time.time()
-    
+
     # Load configuration
     config = load_configuration(config_path) if config_path else {}
     
@@ -207,9 +267,7 @@ def run_assessment(file_path: str,
     
     # Save results if output path provided
     if output_path:
-        import json
-        with open(output_path, "w") as f:
-            json.dump(results, f, indent=2)
+        _dump_json(results, output_path)
         logger.info(f"Assessment results saved to {output_path}")
     
     return results
@@ -231,12 +289,12 @@ def generate_report(results_path: str,
     Returns:
         Path to the generated report
     """
+    from sage.reports.generator import generate_html_report
+
     logger.info(f"Generating {format} report from {results_path}")
-    
+
     # Load results
-    import json
-    with open(results_path, "r") as f:
-        results = json.load(f)
+    results = _load_json(results_path)
     
     # Generate report based on format
     if format == "html":
@@ -273,19 +331,19 @@ def profile_data(file_path: str,
     Returns:
         Profiling results
     """
+    from sage.data.loader import load_data
     from sage.data.profiler import profile_dataframe
-    
+
     logger.info(f"Starting data profiling of {file_path}")
     start_time = time.time()
     
-    # Load data
+    # Load data, pushing the sample limit into the reader so a sampled
+    # profile never materializes the full file
     logger.info("Loading data...")
-    df = load_data(file_path, sheet_name=sheet_name)
-    
-    # Apply sampling if requested
-    if sample_size and 0 < sample_size < len(df):
-        df = df.sample(sample_size, random_state=42)
-        logger.info(f"Sampled {sample_size} rows from dataset")
+    df = load_data(file_path, sheet_name=sheet_name,
+                   nrows=sample_size if sample_size else None)
+    if sample_size and len(df) == sample_size:
+        logger.info(f"Limited load to the first {sample_size} rows")
     
     logger.info(f"Profiling data with {len(df)} rows and {len(df.columns)} columns")
     
@@ -305,9 +363,7 @@ def profile_data(file_path: str,
     
     # Save results if output path provided
     if output_path:
-        import json
-        with open(output_path, "w") as f:
-            json.dump(profile_results, f, indent=2)
+        _dump_json(profile_results, output_path)
         logger.info(f"Profiling results saved to {output_path}")
     
     # Print summary to console
@@ -5,6 +5,7 @@ This module provides functions for formatting and displaying output
 in the command-line interface, including tables, colors, and rich text.
 """
 
+import functools
 import os
 import sys
 import json
@@ -47,10 +48,44 @@ class Colors:
     BG_WHITE = "\033[47m"
 
 
+# Combined style prefixes, concatenated once at import so the hot print
+# paths never re-join color codes per call
+_BOLD_GREEN = Colors.BOLD + Colors.BRIGHT_GREEN
+_STATUS_STYLES = {
+    "passed": Colors.GREEN + Colors.BOLD,
+    "warning": Colors.YELLOW + Colors.BOLD,
+    "failed": Colors.RED + Colors.BOLD,
+}
+_PRIORITY_COLORS = {
+    "high": Colors.RED,
+    "medium": Colors.YELLOW,
+}
+
+# Shared wrapper for recommendation descriptions - textwrap.fill builds
+# (and regex-compiles) a fresh TextWrapper per call
+_REC_WRAPPER = textwrap.TextWrapper(width=80, initial_indent="   ",
+                                    subsequent_indent="   ")
+
+
+def _emit(lines: List[str]) -> None:
+    """Write buffered output lines to stdout in a single call.
+
+    One write and one flush per block instead of one syscall per line -
+    the print helpers accumulate into a list and hand it here.
+    """
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+
+
+@functools.lru_cache(maxsize=None)
 def supports_color() -> bool:
     """
     Check if the terminal supports color output.
-    
+
+    The answer cannot change mid-process, so it is computed once and
+    memoized - every print helper consults it per line of output.
+    Tests that monkeypatch the environment can call reset_color_cache().
+
     Returns:
         True if color is supported, False otherwise
     """
@@ -92,6 +127,11 @@ def supports_color() -> bool:
     return True
 
 
+def reset_color_cache() -> None:
+    """Forget the memoized color-support answer (for tests that patch env)."""
+    supports_color.cache_clear()
+
+
 def colorize(text: str, color: str, use_color: Optional[bool] = None) -> str:
     """
     Add color to text for terminal output.
@@ -108,7 +148,7 @@ def colorize(text: str, color: str, use_color: Optional[bool] = None) -> str:
         use_color = supports_color()
         
     if use_color:
-        return f"{color}{text}{Colors.RESET}"
+        return "".join((color, text, Colors.RESET))
     return text
 
 
@@ -153,14 +193,13 @@ def print_banner(text: str, width: int = 80, char: str = "=") -> None:
     text_line = char * padding + " " + text + " " + char * (width - len(text) - padding - 2)
     
     if use_color:
-        print(colorize(banner_line, Colors.BRIGHT_CYAN))
-        print(colorize(text_line, Colors.BRIGHT_CYAN))
-        print(colorize(banner_line, Colors.BRIGHT_CYAN))
+        lines = [colorize(banner_line, Colors.BRIGHT_CYAN),
+                 colorize(text_line, Colors.BRIGHT_CYAN),
+                 colorize(banner_line, Colors.BRIGHT_CYAN)]
     else:
-        print(banner_line)
-        print(text_line)
-        print(banner_line)
-    print()
+        lines = [banner_line, text_line, banner_line]
+    lines.append("")
+    _emit(lines)
 
 
 def print_section(title: str, underline: bool = True) -> None:
@@ -172,18 +211,14 @@ def print_section(title: str, underline: bool = True) -> None:
         underline: Whether to add an underline
     """
     use_color = supports_color()
-    
-    if use_color:
-        print(colorize(title, Colors.BOLD + Colors.BRIGHT_GREEN))
-    else:
-        print(title)
-        
+
+    lines = [colorize(title, _BOLD_GREEN) if use_color else title]
     if underline:
-        if use_color:
-            print(colorize("-" * len(title), Colors.BRIGHT_GREEN))
-        else:
-            print("-" * len(title))
-    print()
+        underline_text = "-" * len(title)
+        lines.append(colorize(underline_text, Colors.BRIGHT_GREEN)
+                     if use_color else underline_text)
+    lines.append("")
+    _emit(lines)
 
 
 def print_table(data: List[Dict[str, Any]], 
@@ -207,19 +242,27 @@ def print_table(data: List[Dict[str, Any]],
     
     # Determine columns to display
     if not columns:
-        # Get all unique keys from all dictionaries
-        columns = list(set().union(*(d.keys() for d in data)))
-        
+        # Collect keys in first-seen order - no set reshuffling
+        seen: Dict[str, None] = {}
+        for d in data:
+            seen.update(dict.fromkeys(d.keys()))
+        columns = list(seen)
+
     # Sort data if requested
     if sort_by and sort_by in columns:
         data = sorted(data, key=lambda x: x.get(sort_by, ""))
-    
+
+    # Stringify every cell once up front; the width pass and the row
+    # formatting below both read this table instead of re-walking the
+    # source dicts and re-calling str per visit
+    cells: List[List[str]] = [[str(row.get(col, "")) for col in columns] for row in data]
+
     # Calculate column widths
-    col_widths = {}
-    for col in columns:
+    col_widths: Dict[str, int] = {}
+    for j, col in enumerate(columns):
         # Width is the max of the column name and the longest value
         header_width = len(str(col))
-        value_width = max((len(str(row.get(col, ""))) for row in data), default=0)
+        value_width = max((len(row[j]) for row in cells), default=0)
         col_widths[col] = min(max(header_width, value_width), 40)  # Limit column width
     
     # Check if total width exceeds max_width
@@ -230,27 +273,29 @@ def print_table(data: List[Dict[str, Any]],
         for col in col_widths:
             col_widths[col] = max(10, int(col_widths[col] * scale_factor))
     
-    # Print header
+    # Header and separator
     header = " | ".join(str(col).ljust(col_widths[col]) for col in columns)
-    if use_color:
-        print(colorize(header, Colors.BOLD))
-    else:
-        print(header)
-    
-    # Print separator
-    separator = "-+-".join("-" * col_widths[col] for col in columns)
-    print(separator)
-    
-    # Print rows
-    for row in data:
+    lines = [colorize(header, Colors.BOLD) if use_color else header,
+             "-+-".join("-" * col_widths[col] for col in columns)]
+
+    # Rows: per-column specs are resolved once - "{:<W.Ws}" pads and
+    # clips in a single C-level format op, and the width/cut-point pair
+    # is precomputed so the ellipsis branch does no dict lookups
+    col_specs = [(j, col_widths[col], col_widths[col] - 3,
+                  f"{{:<{col_widths[col]}.{col_widths[col]}s}}".format)
+                 for j, col in enumerate(columns)]
+    for row in cells:
         row_values = []
-        for col in columns:
-            value = str(row.get(col, ""))
+        for j, width, cut, fmt in col_specs:
+            value = row[j]
             # Truncate if too long
-            if len(value) > col_widths[col]:
-                value = value[:col_widths[col] - 3] + "..."
-            row_values.append(value.ljust(col_widths[col]))
-        print(" | ".join(row_values))
+            if len(value) > width:
+                value = value[:cut] + "..."
+            row_values.append(fmt(value))
+        lines.append(" | ".join(row_values))
+
+    # The whole table goes out in one write
+    _emit(lines)
 
 
 def print_result(result: Dict[str, Any]) -> None:
@@ -263,40 +308,33 @@ def print_result(result: Dict[str, Any]) -> None:
     # Print banner
     print_banner("SAGE Assessment Results")
     
-    # Print metadata
+    # Metadata block, buffered into one write
     metadata = result.get("metadata", {})
-    print(f"File: {metadata.get('file_path', 'Unknown')}")
-    print(f"Rows: {metadata.get('rows', 0):,}")
-    print(f"Columns: {metadata.get('columns', 0):,}")
-    print(f"Assessment Time: {metadata.get('assessment_time', 0):.2f} seconds")
-    print(f"Metrics Used: {', '.join(metadata.get('metrics_used', []))}")
-    print()
-    
-    # Print overall score if available
+    lines = [f"File: {metadata.get('file_path', 'Unknown')}",
+             f"Rows: {metadata.get('rows', 0):,}",
+             f"Columns: {metadata.get('columns', 0):,}",
+             f"Assessment Time: {metadata.get('assessment_time', 0):.2f} seconds",
+             f"Metrics Used: {', '.join(metadata.get('metrics_used', []))}",
+             ""]
+
+    # Overall score if available
     if "overall_score" in result:
         score = result["overall_score"]
         status = result.get("overall_status", "unknown")
-        
+
         use_color = supports_color()
         score_str = f"{score:.1%}"
-        
+
         if use_color:
-            if status == "passed":
-                status_color = Colors.GREEN
-            elif status == "warning":
-                status_color = Colors.YELLOW
-            elif status == "failed":
-                status_color = Colors.RED
-            else:
-                status_color = Colors.RESET
-                
-            print(f"Overall Score: {colorize(score_str, status_color + Colors.BOLD)}")
-            print(f"Status: {colorize(status.title(), status_color + Colors.BOLD)}")
+            status_style = _STATUS_STYLES.get(status, Colors.RESET + Colors.BOLD)
+            lines.append(f"Overall Score: {colorize(score_str, status_style)}")
+            lines.append(f"Status: {colorize(status.title(), status_style)}")
         else:
-            print(f"Overall Score: {score_str}")
-            print(f"Status: {status.title()}")
-        
-        print()
+            lines.append(f"Overall Score: {score_str}")
+            lines.append(f"Status: {status.title()}")
+        lines.append("")
+
+    _emit(lines)
     
     # Print metric scores
     metrics = result.get("metrics", {})
@@ -329,30 +367,25 @@ def print_result(result: Dict[str, Any]) -> None:
     recommendations = result.get("recommendations", [])
     if recommendations:
         print_section("Recommendations")
-        
+
+        use_color = supports_color()
+        rec_lines = []
         for i, rec in enumerate(recommendations, 1):
             priority = rec.get("priority", "medium")
             title = rec.get("title", f"Recommendation {i}")
             description = rec.get("description", "")
-            
-            use_color = supports_color()
+
             if use_color:
-                if priority == "high":
-                    priority_color = Colors.RED
-                elif priority == "medium":
-                    priority_color = Colors.YELLOW
-                else:
-                    priority_color = Colors.GREEN
-                    
-                print(f"{i}. {colorize(title, Colors.BOLD)}")
-                print(f"   Priority: {colorize(priority.title(), priority_color)}")
-                print(textwrap.fill(description, width=80, initial_indent="   ", subsequent_indent="   "))
+                priority_color = _PRIORITY_COLORS.get(priority, Colors.GREEN)
+                rec_lines.append(f"{i}. {colorize(title, Colors.BOLD)}")
+                rec_lines.append(f"   Priority: {colorize(priority.title(), priority_color)}")
             else:
-                print(f"{i}. {title}")
-                print(f"   Priority: {priority.title()}")
-                print(textwrap.fill(description, width=80, initial_indent="   ", subsequent_indent="   "))
-            
-            print()
+                rec_lines.append(f"{i}. {title}")
+                rec_lines.append(f"   Priority: {priority.title()}")
+            rec_lines.append(_REC_WRAPPER.fill(description))
+            rec_lines.append("")
+
+        _emit(rec_lines)
 
 
 def print_error(message: str) -> None:
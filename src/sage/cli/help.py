@@ -6,14 +6,31 @@ This module provides interactive documentation and examples.
 
 import sys
 import textwrap
-import importlib
-import inspect
 from typing import Dict, List, Optional, Any
 
+# Modules searched for named objects, imported lazily and cached so
+# repeat help lookups never re-import them
+_MODULES_TO_SEARCH = (
+    'sage.graders.excel_grader',
+    'sage.graders.database_grader',
+    'sage.metrics.completeness',
+    'sage.metrics.accuracy',
+    'sage.metrics.consistency',
+    'sage.metrics.timeliness',
+    'sage.data.loader',
+    'sage.data.profiler',
+    'sage.reports.generator'
+)
+_MODULE_CACHE: Dict[str, Any] = {}
+
+# Reverse index {symbol name: module name}, built once on the first
+# by-name lookup so later queries are a single dict hit
+_SYMBOL_INDEX: Dict[str, str] = {}
+
 def show_help(topic: Optional[str] = None) -> None:
     """
     Display help information about SAGE.
-    
+
     Args:
         topic: Optional specific topic to show help for
     """
@@ -27,28 +44,28 @@ def _show_general_help() -> None:
     print(textwrap.dedent("""
     SAGE - Spreadsheet Analysis Grading Engine
     ==========================================
-    
+
     SAGE helps you assess and grade data quality in spreadsheets and databases.
-    
+
     Main components:
-    
+
     - Graders: Classes for grading different data sources
       (sage.graders.excel_grader, sage.graders.database_grader)
-    
+
     - Metrics: Quality metrics to assess data
       (sage.metrics.completeness, sage.metrics.accuracy, etc.)
-    
+
     - Reports: Generate reports from quality assessments
       (sage.reports.generator)
-    
+
     - Data: Load and profile data
       (sage.data.loader, sage.data.profiler)
-    
+
     Examples:
-    
+
     - To get help on a specific module: sage.help("graders")
     - To get help on a specific class: sage.help("ExcelGrader")
-    
+
     For more information, visit the full documentation at:
     https://github.com/YourUsername/SAGE/docs
     """))
@@ -56,37 +73,38 @@ def _show_general_help() -> None:
 def _show_topic_help(topic: str) -> None:
     """
     Display help for a specific topic.
-    
+
     Args:
         topic: Topic to show help for (module, class, or function name)
     """
+    import inspect
+
     # Remove 'sage.' prefix if present
     if topic.startswith('sage.'):
         topic = topic[5:]
-    
+
     # Try to find the object in the sage package
     try:
         # First try direct import
         module_parts = topic.split('.')
         if len(module_parts) > 1:
             # It's a module path
-            module_name = f"sage.{topic}"
-            obj = importlib.import_module(module_name)
+            obj = _import_module(f"sage.{topic}")
         else:
             # It might be a class or function name - search for it
             obj = _find_object_by_name(topic)
-            
+
         if obj:
             # Display the object's docstring
             print("\n", "-" * 80)
             print(f"Help for: {topic}")
             print("-" * 80)
-            
+
             if obj.__doc__:
                 print(textwrap.dedent(obj.__doc__))
             else:
                 print("No documentation available.")
-                
+
             # If it's a module, list its contents
             if inspect.ismodule(obj):
                 print("\nContents:")
@@ -95,45 +113,47 @@ def _show_topic_help(topic: str) -> None:
                         kind = type(item).__name__
                         if inspect.isclass(item) or inspect.isfunction(item):
                             print(f"- {name}: {kind}")
-            
+
             print("-" * 80)
         else:
             print(f"Topic '{topic}' not found in SAGE.")
-            
+
     except (ImportError, AttributeError) as e:
         print(f"Error finding help for '{topic}': {e}")
         print("Try a more general topic or check the spelling.")
 
+def _import_module(module_name: str) -> Any:
+    """Import a module once and serve repeat requests from the cache."""
+    module = _MODULE_CACHE.get(module_name)
+    if module is None:
+        import importlib
+        module = importlib.import_module(module_name)
+        _MODULE_CACHE[module_name] = module
+    return module
+
 def _find_object_by_name(name: str) -> Any:
     """
     Search for an object by name within the sage package.
-    
+
     Args:
         name: Name to search for
-        
+
     Returns:
         The found object or None
     """
-    # List of common modules to search in
-    modules_to_search = [
-        'sage.graders.excel_grader',
-        'sage.graders.database_grader',
-        'sage.metrics.completeness',
-        'sage.metrics.accuracy',
-        'sage.metrics.consistency',
-        'sage.metrics.timeliness',
-        'sage.data.loader',
-        'sage.data.profiler',
-        'sage.reports.generator'
-    ]
-    
-    # Search each module for the object
-    for module_name in modules_to_search:
-        try:
-            module = importlib.import_module(module_name)
-            if hasattr(module, name):
-                return getattr(module, name)
-        except ImportError:
-            continue
-    
+    # Build the symbol index on first use: one pass over the search
+    # modules, then every lookup is a dict hit instead of nine probes
+    if not _SYMBOL_INDEX:
+        for module_name in _MODULES_TO_SEARCH:
+            try:
+                module = _import_module(module_name)
+            except ImportError:
+                continue
+            for symbol in dir(module):
+                if not symbol.startswith('_'):
+                    _SYMBOL_INDEX.setdefault(symbol, module_name)
+
+    module_name = _SYMBOL_INDEX.get(name)
+    if module_name is not None:
+        return getattr(_MODULE_CACHE[module_name], name)
     return None
@@ -5,13 +5,6 @@ This package provides functionality for loading and managing
 configuration settings for SAGE.
 """
 
-from sage.config.settings import (
-    load_configuration,
-    validate_configuration,
-    get_default_configuration,
-    merge_configurations
-)
-
 # List of functions to expose when using `from sage.config import *`
 __all__ = [
     'load_configuration',
@@ -19,3 +12,18 @@ __all__ = [
     'get_default_configuration',
     'merge_configurations'
 ]
+
+
+def __getattr__(name):
+    """Resolve the settings re-exports lazily (PEP 562) on first access."""
+    if name in __all__:
+        from sage.config import settings
+        value = getattr(settings, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    """Include lazily exported attributes in dir(sage.config)."""
+    return sorted(list(globals().keys()) + __all__)
@@ -10,39 +10,65 @@ import logging
 from typing import Optional, Union, Dict, Any
 import pandas as pd
 
+# Try to use pyarrow's multithreaded CSV parser - several times faster
+# than pandas' own for large files
+try:
+    import pyarrow.csv as pacsv
+    HAS_PYARROW_CSV = True
+except ImportError:
+    HAS_PYARROW_CSV = False
+
+# Try to use the Rust-backed calamine engine for Excel files
+try:
+    import python_calamine  # noqa: F401
+    HAS_CALAMINE = True
+except ImportError:
+    HAS_CALAMINE = False
+
 # Set up logger
 logger = logging.getLogger("sage.data.loader")
 
-def load_data(file_path: str, 
+def load_data(file_path: str,
              sheet_name: Optional[str] = None,
+             nrows: Optional[int] = None,
              **kwargs) -> pd.DataFrame:
     """
     Load data from a file into a pandas DataFrame.
-    
+
     Supports various file formats including CSV, Excel, JSON, and parquet.
-    
+
     Args:
         file_path: Path to the data file
         sheet_name: For Excel files, the name of the sheet to load
+        nrows: Optional row limit - pushed into the reader for formats
+            that support it, so sampling never materializes the full file
         **kwargs: Additional arguments to pass to the pandas read functions
-        
+
     Returns:
         Loaded DataFrame
-        
+
     Raises:
         FileNotFoundError: If the file doesn't exist
         ValueError: If the file format is not supported
     """
     if not os.path.exists(file_path):
         raise FileNotFoundError(f"File not found: {file_path}")
-    
+
     # Determine file type from extension
     _, ext = os.path.splitext(file_path.lower())
-    
+
+    # CSV and Excel readers can stop after nrows rows; other formats
+    # load fully and are trimmed below
+    if nrows is not None and ext in ['.csv', '.xlsx', '.xls', '.xlsm',
+                                     '.xlsb', '.odf', '.ods', '.odt']:
+        kwargs.setdefault('nrows', nrows)
+
     try:
         if ext in ['.xlsx', '.xls', '.xlsm', '.xlsb', '.odf', '.ods', '.odt']:
             # Excel files
             logger.info(f"Loading Excel file: {file_path}")
+            if HAS_CALAMINE and ext == '.xlsx':
+                kwargs.setdefault('engine', 'calamine')
             if sheet_name:
                 logger.info(f"Using sheet: {sheet_name}")
                 df = pd.read_excel(file_path, sheet_name=sheet_name, **kwargs)
@@ -51,9 +77,14 @@ def load_data(file_path: str,
                 df = pd.read_excel(file_path, **kwargs)
                 
         elif ext == '.csv':
-            # CSV files
+            # CSV files: route plain reads through pyarrow's parser when
+            # installed; reads with pandas-specific options or a row
+            # limit keep using pd.read_csv
             logger.info(f"Loading CSV file: {file_path}")
-            df = pd.read_csv(file_path, **kwargs)
+            if HAS_PYARROW_CSV and not kwargs:
+                df = pacsv.read_csv(file_path).to_pandas(self_destruct=True)
+            else:
+                df = pd.read_csv(file_path, **kwargs)
             
         elif ext == '.json':
             # JSON files
@@ -100,7 +131,11 @@ def load_data(file_path: str,
             
         else:
             raise ValueError(f"Unsupported file format: {ext}")
-        
+
+        # Formats whose readers cannot stop early are trimmed after load
+        if nrows is not None and len(df) > nrows:
+            df = df.head(nrows)
+
         logger.info(f"Successfully loaded data with {len(df)} rows and {len(df.columns)} columns")
         return df
         
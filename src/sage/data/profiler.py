@@ -76,16 +76,26 @@ class DataProfiler:
         
         logger.info(f"Profiling DataFrame with {len(self.data)} rows and {len(self.data.columns)} columns")
         
-        # Calculate overall statistics
+        # Calculate overall statistics; compute each counter once and
+        # derive the ratios from it so callers never have to redo the
+        # arithmetic (or its divide-by-zero guards) themselves
+        row_count = len(self.data)
+        column_count = len(self.data.columns)
+        total_cells = row_count * column_count
+        missing_cells = self.data.isna().sum().sum()
+        duplicate_rows = self.data.duplicated().sum()
+
         self.overall_stats = {
-            'row_count': len(self.data),
-            'column_count': len(self.data.columns),
+            'row_count': row_count,
+            'column_count': column_count,
+            'total_cells': total_cells,
             'memory_usage': self.data.memory_usage(deep=True).sum(),
             'data_types': self.data.dtypes.value_counts().to_dict(),
-            'missing_cells': self.data.isna().sum().sum(),
-            'missing_percent': float(self.data.isna().sum().sum() / (len(self.data) * len(self.data.columns))),
-            'duplicate_rows': self.data.duplicated().sum(),
-            'duplicate_percent': float(self.data.duplicated().sum() / len(self.data) if len(self.data) > 0 else 0),
+            'missing_cells': missing_cells,
+            'missing_ratio': float(missing_cells / total_cells) if total_cells > 0 else 0.0,
+            'missing_percent': float(missing_cells / total_cells) if total_cells > 0 else 0.0,
+            'duplicate_rows': duplicate_rows,
+            'duplicate_percent': float(duplicate_rows / row_count) if row_count > 0 else 0.0,
             'column_names': list(self.data.columns)
         }
         
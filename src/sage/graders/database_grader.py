@@ -13,6 +13,7 @@ import pandas as pd
 import re
 
 from sage.graders.base_grader import BaseGrader
+from sage.utils.sqlcache import QueryCache
 
 # Set up logger
 logger = logging.getLogger("sage.graders.database")
@@ -42,7 +43,11 @@ class DatabaseGrader(BaseGrader):
         self.db_type = None          # Type of database (postgresql, mysql, etc.)
         self.active_schema = None    # Currently selected schema
         self.active_table = None     # Currently selected table
-        
+        self.categorical_columns = []  # Columns loaded as category dtype
+        self._tables_cache = {}      # Reflected table names per schema
+        self._columns_cache = {}     # Reflected column info per (schema, table)
+        self.query_cache = QueryCache()  # Memoized query results
+
         logger.debug(f"Initialized database grader: {self.name}")
     
     def connect(self, source: Union[str, sqlalchemy.engine.Engine]) -> bool:
@@ -70,7 +75,10 @@ class DatabaseGrader(BaseGrader):
             self.active_schema = None
             self.active_table = None
             self.is_connected = False
-            
+            self._tables_cache = {}
+            self._columns_cache = {}
+            self.query_cache.invalidate()
+
             if isinstance(source, str):
                 # It's a connection string
                 logger.info(f"Connecting to database: {self._mask_connection_string(source)}")
@@ -152,12 +160,17 @@ class DatabaseGrader(BaseGrader):
             return []
         
         use_schema = schema or self.active_schema
-        
-        try:
-            return self.inspector.get_table_names(schema=use_schema)
-        except Exception as e:
-            logger.error(f"Error getting tables for schema '{use_schema}': {str(e)}")
-            return []
+
+        # Reflect each schema's table names once per connection: the list
+        # is consulted on every set_active_table call and reflection is a
+        # round trip to the database
+        if use_schema not in self._tables_cache:
+            try:
+                self._tables_cache[use_schema] = self.inspector.get_table_names(schema=use_schema)
+            except Exception as e:
+                logger.error(f"Error getting tables for schema '{use_schema}': {str(e)}")
+                return []
+        return self._tables_cache[use_schema]
     
     def set_active_schema(self, schema: str) -> bool:
         """
@@ -215,7 +228,24 @@ class DatabaseGrader(BaseGrader):
         self.active_table = table
         logger.debug(f"Set active table to: {use_schema}.{table}")
         return True
-    
+
+    def set_categorical_columns(self, columns: List[str]) -> None:
+        """
+        Mark columns to be loaded as pandas Categoricals during grading.
+
+        Low-cardinality string columns (statuses, payment methods, ...)
+        compare much faster as category dtype: isin-style checks run on
+        integer codes instead of Python strings, and the column uses a
+        fraction of the memory. Categories are taken from the data, so
+        unexpected values are preserved rather than coerced to NaN.
+
+        Args:
+            columns: Column names to convert after the table is loaded;
+                     names not present in a table are ignored
+        """
+        self.categorical_columns = list(columns)
+        logger.debug(f"Set categorical columns: {self.categorical_columns}")
+
     def get_table_info(self, table: Optional[str] = None, schema: Optional[str] = None) -> Dict[str, Any]:
         """
         Get detailed information about a table.
@@ -236,37 +266,50 @@ class DatabaseGrader(BaseGrader):
         if not use_table:
             raise ValueError("No active table selected")
         
-        # Get column information
+        # Get column information, reflecting each table only once per
+        # connection — the schema doesn't change underneath a grading run
         try:
-            columns = {}
-            col_info = self.inspector.get_columns(use_table, schema=use_schema)
-            
-            for col in col_info:
-                col_name = col['name']
-                columns[col_name] = {
-                    "type": str(col['type']),
-                    "nullable": col.get('nullable', True),
-                    "default": col.get('default', None),
-                    "primary_key": False  # Will be updated below if it's a PK
-                }
-            
-            # Get primary key information
-            try:
-                pk_info = self.inspector.get_pk_constraint(use_table, schema=use_schema)
-                pk_columns = pk_info.get('constrained_columns', [])
-                
-                for col in pk_columns:
-                    if col in columns:
-                        columns[col]['primary_key'] = True
-            except Exception as e:
-                logger.warning(f"Could not get primary key information: {str(e)}")
-            
-            # Get row count (this might be slow for large tables)
+            cache_key = (use_schema, use_table)
+            columns = self._columns_cache.get(cache_key)
+            if columns is None:
+                columns = {}
+                col_info = self.inspector.get_columns(use_table, schema=use_schema)
+
+                for col in col_info:
+                    col_name = col['name']
+                    columns[col_name] = {
+                        "type": str(col['type']),
+                        "nullable": col.get('nullable', True),
+                        "default": col.get('default', None),
+                        "primary_key": False  # Will be updated below if it's a PK
+                    }
+
+                # Get primary key information
+                try:
+                    pk_info = self.inspector.get_pk_constraint(use_table, schema=use_schema)
+                    pk_columns = pk_info.get('constrained_columns', [])
+
+                    for col in pk_columns:
+                        if col in columns:
+                            columns[col]['primary_key'] = True
+                except Exception as e:
+                    logger.warning(f"Could not get primary key information: {str(e)}")
+
+                self._columns_cache[cache_key] = columns
+
+            # Get row count (this might be slow for large tables);
+            # memoized, since every grade() call re-requests it. The
+            # entry is namespaced via the params slot so this scalar can
+            # never collide with a DataFrame execute_query cached for
+            # the same statement text
             row_count = None
             try:
                 query = f"SELECT COUNT(*) FROM {use_schema}.{use_table}" if use_schema else f"SELECT COUNT(*) FROM {use_table}"
-                result = self.connection.execute(sqlalchemy.text(query))
-                row_count = result.scalar()
+                row_count = self.query_cache.get(query, params=('row_count',))
+                if row_count is None:
+                    result = self.connection.execute(sqlalchemy.text(query))
+                    row_count = result.scalar()
+                    self.query_cache.put(query, row_count, params=('row_count',))
             except Exception as e:
                 logger.warning(f"Could not get row count: {str(e)}")
             
@@ -298,9 +341,18 @@ class DatabaseGrader(BaseGrader):
         """
         if not self.is_connected or not self.connection:
             raise ValueError("Not connected to a database")
-        
+
         try:
-            return pd.read_sql(query, self.connection)
+            # Serve repeated statements from the query cache; copies are
+            # handed out so callers can mutate their frame freely, and
+            # oversized results bypass the cache entirely
+            cached = self.query_cache.get(query)
+            if cached is not None:
+                return cached.copy()
+            df = pd.read_sql(query, self.connection)
+            if self.query_cache.put(query, df):
+                return df.copy()
+            return df
         except Exception as e:
             logger.error(f"Error executing query: {str(e)}")
             raise
@@ -339,6 +391,12 @@ class DatabaseGrader(BaseGrader):
         except Exception as e:
             logger.error(f"Failed to load table data: {str(e)}")
             raise ValueError(f"Could not load data from table: {str(e)}")
+
+        # Convert the configured low-cardinality columns to category dtype
+        # so metric checks compare integer codes rather than Python strings
+        for col in self.categorical_columns:
+            if col in df.columns:
+                df[col] = pd.Categorical(df[col])
         
         # Run each metric and collect results
         results = {}
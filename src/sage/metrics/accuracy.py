@@ -77,25 +77,28 @@ class AccuracyMetric(BaseMetric):
             log_msg += f" max={max_value}"
         logger.debug(log_msg)
     
-    def add_pattern_check(self, column: str, pattern: str) -> None:
+    def add_pattern_check(self, column: str, pattern: Union[str, re.Pattern]) -> None:
         """
         Add a regex pattern validation check for a string column.
-        
+
         Args:
             column: Column name to validate
-            pattern: Regular expression pattern that valid values must match
-            
+            pattern: Regular expression (string or pre-compiled pattern)
+                that valid values must match
+
         Raises:
-            re.error: If the pattern is invalid
+            ValueError: If the pattern is invalid
         """
-        # Validate the pattern by compiling it
-        try:
-            re.compile(pattern)
-        except re.error as e:
-            raise ValueError(f"Invalid regular expression pattern: {e}")
-        
+        # Compile once here so evaluation never re-compiles per call;
+        # pre-compiled patterns are stored as-is
+        if not isinstance(pattern, re.Pattern):
+            try:
+                pattern = re.compile(pattern)
+            except re.error as e:
+                raise ValueError(f"Invalid regular expression pattern: {e}")
+
         self.pattern_checks[column] = pattern
-        logger.debug(f"Added pattern check for '{column}': {pattern}")
+        logger.debug(f"Added pattern check for '{column}': {pattern.pattern}")
     
     def add_categorical_check(self, column: str, allowed_values: List[Any]) -> None:
         """
@@ -113,7 +116,36 @@ class AccuracyMetric(BaseMetric):
         
         self.categorical_checks[column] = set(allowed_values)
         logger.debug(f"Added categorical check for '{column}' with {len(allowed_values)} allowed values")
-    
+
+    def load_rules(self, rules: Dict[str, Dict[str, Any]]) -> None:
+        """
+        Load a batch of validation rules from a declarative config dict.
+
+        This is a convenience wrapper over the add_*_check methods, so
+        regexes are compiled once at load time and categorical values are
+        stored as sets just as with individual calls.
+
+        Args:
+            rules: Dictionary with any of the keys:
+                'patterns': {column: regex string or compiled pattern}
+                'ranges': {column: (min_value, max_value) tuple}
+                'categoricals': {column: list of allowed values}
+
+        Raises:
+            ValueError: If any individual rule is invalid
+        """
+        for column, pattern in rules.get('patterns', {}).items():
+            self.add_pattern_check(column, pattern)
+
+        for column, (min_value, max_value) in rules.get('ranges', {}).items():
+            self.add_range_check(column, min_value=min_value, max_value=max_value)
+
+        for column, allowed_values in rules.get('categoricals', {}).items():
+            self.add_categorical_check(column, allowed_values)
+
+        logger.debug(f"Loaded {len(self.range_checks)} range, {len(self.pattern_checks)} pattern, "
+                     f"{len(self.categorical_checks)} categorical checks from rules config")
+
     def _evaluate_range_check(self, df: pd.DataFrame, column: str, check: Dict[str, Any]) -> Dict[str, Any]:
         """
         Evaluate a range check on a column.
@@ -173,7 +205,7 @@ class AccuracyMetric(BaseMetric):
             'message': f"Range check ({', '.join(message)}): {invalid_count} values outside range"
         }
     
-    def _evaluate_pattern_check(self, df: pd.DataFrame, column: str, pattern: str) -> Dict[str, Any]:
+    def _evaluate_pattern_check(self, df: pd.DataFrame, column: str, pattern: Union[str, re.Pattern]) -> Dict[str, Any]:
         """
         Evaluate a pattern check on a column.
         
@@ -200,19 +232,19 @@ class AccuracyMetric(BaseMetric):
             # Convert to string if not already
             if not pd.api.types.is_string_dtype(col_data):
                 col_data = col_data.astype(str)
-                
-            # Compile pattern
-            regex = re.compile(pattern)
-            
-            # Apply pattern check
-            matches = col_data.apply(lambda x: bool(regex.match(str(x))))
+
+            # Patterns are compiled once in add_pattern_check
+            regex = pattern if isinstance(pattern, re.Pattern) else re.compile(pattern)
+
+            # Apply pattern check in one vectorized pass
+            matches = col_data.str.match(regex)
             valid_count = matches.sum()
             invalid_count = len(col_data) - valid_count
-            
+
             return {
                 'valid': valid_count,
                 'invalid': invalid_count,
-                'message': f"Pattern check ({pattern}): {invalid_count} values don't match pattern"
+                'message': f"Pattern check ({regex.pattern}): {invalid_count} values don't match pattern"
             }
             
         except Exception as e:
@@ -143,9 +143,10 @@ def generate_dataframe_preview(df: pd.DataFrame, max_rows: int = 10) -> str:
     # Generate header
     header = list(preview_df.columns)
     
-    # Generate rows
+    # Generate rows; itertuples yields plain tuples without building a
+    # Series per row like iterrows does
     rows = []
-    for _, row in preview_df.iterrows():
+    for row in preview_df.itertuples(index=False, name=None):
         # Format the values for display
         formatted_row = []
         for val in row:
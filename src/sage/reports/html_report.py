@@ -18,6 +18,25 @@ import pandas as pd  # Add missing pandas import
 # Set up logger
 logger = logging.getLogger("sage.reports.html")
 
+# Shared Jinja environment - building an Environment and re-registering the
+# custom filters on every report call is wasted work
+_jinja_env = jinja2.Environment(auto_reload=False, cache_size=400)
+_jinja_env.filters['date'] = lambda d, format='%Y-%m-%d': d.strftime(format) if isinstance(d, (datetime.date, datetime.datetime)) else d
+_jinja_env.filters['percent'] = lambda f: f'{f:.1%}' if isinstance(f, (int, float)) else f
+
+# Compiled templates keyed by their source, so repeat renders of the same
+# template skip Jinja's lexer/parser entirely
+_template_cache: Dict[str, jinja2.Template] = {}
+
+
+def _get_compiled_template(template_str: str) -> jinja2.Template:
+    """Return a compiled template for the given source, compiling it once."""
+    template = _template_cache.get(template_str)
+    if template is None:
+        template = _jinja_env.from_string(template_str)
+        _template_cache[template_str] = template
+    return template
+
 # Try to import visualization components
 try:
     import matplotlib
@@ -1002,18 +1021,11 @@ def generate_html_report(data: Dict[str, Any], output_path: str, template_path:
             template_str = _get_default_template()
             logger.debug("Using default template")
         
-        # Set up Jinja environment for templating
-        env = jinja2.Environment()
-        
-        # Add custom filters for data formatting
-        env.filters['date'] = lambda d, format='%Y-%m-%d': d.strftime(format) if isinstance(d, (datetime.date, datetime.datetime)) else d
-        env.filters['percent'] = lambda f: f'{f:.1%}' if isinstance(f, (int, float)) else f
-        
-        # The filter approach is cleaner than doing this formatting in Python code
-        # before passing to the template
-        
-        # Create template
-        template = env.from_string(template_str)
+        # Get the compiled template from the shared environment; the custom
+        # date/percent filters are registered on it once at import time.
+        # The filter approach is cleaner than doing this formatting in Python
+        # code before passing to the template
+        template = _get_compiled_template(template_str)
         
         # Determine overall score if not provided
         if 'overall_score' not in data and 'metrics' in data:
@@ -1082,13 +1094,13 @@ def generate_html_report(data: Dict[str, Any], output_path: str, template_path:
             **data
         }
         
-        # Render template
-        html_output = template.render(**template_vars)
-        
-        # Write to file
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(html_output)
-            
+        # Stream the rendered template straight to disk in chunks so the
+        # full report never has to exist as one string in memory.
+        # dump() only opens the target itself when given a str, so
+        # normalize PathLike arguments first
+        template.stream(**template_vars).dump(os.fspath(output_path), encoding='utf-8')
+
+
         logger.info(f"HTML report generated successfully at: {output_path}")
         return True
         
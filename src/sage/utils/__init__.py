@@ -17,6 +17,7 @@ from sage.utils.helpers import (
 )
 
 from sage.utils.template_engine import TemplateEngine
+from sage.utils.sqlcache import QueryCache
 
 # List of functions to expose when using `from sage.utils import *`
 __all__ = [
@@ -29,5 +30,6 @@ __all__ = [
     'validate_file_exists',
     'normalize_column_names',
     'is_empty_value',
-    'TemplateEngine'
+    'TemplateEngine',
+    'QueryCache'
 ]
@@ -195,6 +195,25 @@ class TestDatabaseGrader(unittest.TestCase):
         self.assertIn('email', columns)
         self.assertIn('score', columns)
     
+    def test_count_query_after_table_info(self):
+        """Test that execute_query survives a COUNT cached by get_table_info."""
+        if not self.has_sqlalchemy:
+            self.skipTest("SQLAlchemy not available")
+
+        self.grader.connect(self.engine)
+        self.grader.set_active_table('users')
+
+        # get_table_info memoizes the scalar row count for this statement
+        self.grader.get_table_info()
+
+        # The same statement through the public API must return a DataFrame
+        df = self.grader.execute_query("SELECT COUNT(*) FROM users")
+        self.assertEqual(int(df.iloc[0, 0]), 10)
+
+        # And again, now served from the cache
+        df = self.grader.execute_query("SELECT COUNT(*) FROM users")
+        self.assertEqual(int(df.iloc[0, 0]), 10)
+
     def test_grade_completeness(self):
         """Test grading completeness in database tables."""
         if not self.has_sqlalchemy:
@@ -464,6 +464,30 @@ class TestAccuracyMetric(unittest.TestCase):
         self.assertEqual(category_details['valid'], 4)  # A, B, C, D are valid
         self.assertEqual(category_details['invalid'], 1)  # 'Invalid' is not allowed
     
+    def test_load_rules(self):
+        """Test loading a batch of rules from a declarative config."""
+        # Skip if the batch loader doesn't exist
+        if not hasattr(self.metric, 'load_rules'):
+            self.skipTest("load_rules method not available")
+
+        self.metric.load_rules({
+            'patterns': {'email': r'^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+$'},
+            'ranges': {'age': (0, 100), 'price': (0, None)},
+            'categoricals': {'category': ['A', 'B', 'C', 'D']}
+        })
+
+        # Rules should land in the same storage as individual add_* calls
+        self.assertIn('email', self.metric.pattern_checks)
+        self.assertEqual(self.metric.range_checks['age'],
+                         {'min_value': 0, 'max_value': 100})
+        self.assertEqual(self.metric.categorical_checks['category'],
+                         {'A', 'B', 'C', 'D'})
+
+        # And evaluation should behave as if they were added one by one
+        result = self.metric.evaluate(self.test_data)
+        self.assertIn('score', result)
+        self.assertEqual(result['details']['category']['invalid'], 1)
+
     def test_multiple_validations(self):
         """Test combining multiple validation types."""
         # Configure multiple checks
@@ -0,0 +1,76 @@
+"""
+Tests for the query-result cache.
+
+This module tests the QueryCache used by the database grader to memoize
+repeated SQL statements during grading runs.
+"""
+
+import unittest
+import os
+import sys
+import pandas as pd
+
+# Add the src directory to the path so we can import sage
+project_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+src_dir = os.path.join(project_dir, 'src')
+sys.path.insert(0, src_dir)
+
+# Try to import the query cache
+try:
+    from sage.utils.sqlcache import QueryCache
+    SQLCACHE_AVAILABLE = True
+except ImportError as e:
+    print(f"Import error: {e}")
+    SQLCACHE_AVAILABLE = False
+
+
+class TestQueryCache(unittest.TestCase):
+    """Test case for QueryCache functionality."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        if not SQLCACHE_AVAILABLE:
+            self.skipTest("QueryCache not available")
+        self.cache = QueryCache(maxsize=2)
+
+    def test_hit_and_miss(self):
+        """Test basic store and lookup behavior."""
+        self.assertIsNone(self.cache.get("SELECT COUNT(*) FROM t"))
+        self.cache.put("SELECT COUNT(*) FROM t", 42)
+        self.assertEqual(self.cache.get("SELECT COUNT(*) FROM t"), 42)
+        self.assertEqual(self.cache.hits, 1)
+        self.assertEqual(self.cache.misses, 1)
+
+    def test_params_distinguish_entries(self):
+        """Test that the same SQL with different params caches separately."""
+        self.cache.put("SELECT * FROM t WHERE id = ?", 'first', params=(1,))
+        self.cache.put("SELECT * FROM t WHERE id = ?", 'second', params=(2,))
+        self.assertEqual(self.cache.get("SELECT * FROM t WHERE id = ?", params=(1,)), 'first')
+        self.assertEqual(self.cache.get("SELECT * FROM t WHERE id = ?", params=(2,)), 'second')
+
+    def test_fifo_eviction(self):
+        """Test that the oldest entry is evicted beyond maxsize."""
+        self.cache.put("q1", 1)
+        self.cache.put("q2", 2)
+        self.cache.put("q3", 3)
+        self.assertEqual(len(self.cache), 2)
+        self.assertIsNone(self.cache.get("q1"))
+        self.assertEqual(self.cache.get("q3"), 3)
+
+    def test_oversized_result_skipped(self):
+        """Test that results over the byte cap are not cached."""
+        small_cache = QueryCache(max_result_bytes=64)
+        big_df = pd.DataFrame({'x': range(1000)})
+        self.assertFalse(small_cache.put("SELECT * FROM big", big_df))
+        self.assertIsNone(small_cache.get("SELECT * FROM big"))
+
+    def test_invalidate(self):
+        """Test that invalidate drops every entry."""
+        self.cache.put("q1", 1)
+        self.cache.invalidate()
+        self.assertEqual(len(self.cache), 0)
+        self.assertIsNone(self.cache.get("q1"))
+
+
+if __name__ == '__main__':
+    unittest.main()